@@ -14,7 +14,8 @@ import hashlib
 
 # import ECC framework modules (adjust imports depending on your package layout)
 # If ecc is a package (folder named ecc with __init__.py), use:
-from ecc.curve import EllipticCurve, Point
+from ecc import curves
+from ecc.curve import Point
 from ecc.keys import ECCKeyPair
 from ecc.ecdsa import ECDSA
 from ecc.elgamal import ElGamalECC
@@ -24,21 +25,7 @@ app = Flask(__name__)
 app.secret_key = "dev-secret-key-for-demo"  # use secure secret in production
 
 # Initialize curve and components (secp256k1)
-curve = EllipticCurve(
-    p=0xFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFEFFFFFC2F,
-    a=0,
-    b=7,
-    Gx=55066263022277343669578718895168534326250603453777594175500187360389116729240,
-    Gy=32670510020758816978083085130507043184471273337482424,  # NOTE: fix below in template if needed
-    n=0xFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFEBAAEDCE6AF48A03BBFD25E8CD0364141
-)
-
-# The previous Gx/Gy in earlier code used large integers; ensure you copy correct Gy value
-# Use the standard values below for secp256k1 if the above is wrong:
-curve.G = Point(
-    55066263022277343669578718895168534326250603453777594175500187360389116729240,
-    32670510020758816978083085130507043184471273380659243275938904335757337482424
-)
+curve = curves.get("secp256k1")
 
 # Keypair for demo (server-side single identity)
 keypair = ECCKeyPair(curve)
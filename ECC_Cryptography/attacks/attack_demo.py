@@ -12,19 +12,12 @@ Steps:
 4. Attacker forges a new fraudulent transaction.
 """
 
-from ecc.curve import EllipticCurve
+from ecc import curves
 from ecc.keys import ECCKeyPair
 from ecc.ecdsa import ECDSA
 
 # Use a small curve so the attack is easy to see
-curve = EllipticCurve(
-    p=257,
-    a=1,
-    b=1,
-    Gx=3,
-    Gy=10,
-    n=251
-)
+curve = curves.get("toy257")
 
 def recover_private_key(curve, sig1, sig2, h1, h2):
     """
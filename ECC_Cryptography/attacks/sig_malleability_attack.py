@@ -1,15 +1,11 @@
 # attacks/attack_malleability.py
 
-from ecc.curve import EllipticCurve
+from ecc import curves
 from ecc.keys import ECCKeyPair
 from ecc.ecdsa import ECDSA
 
 # Medium teaching curve
-curve = EllipticCurve(
-    p=9739, a=497, b=1768,
-    Gx=1804, Gy=5368,
-    n=9739
-)
+curve = curves.get("toy9739")
 
 def main():
     print("\n=== SIGNATURE MALLEABILITY ===")
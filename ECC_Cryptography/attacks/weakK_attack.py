@@ -1,16 +1,12 @@
 # attacks/attack_weak_k.py
 
-from ecc.curve import EllipticCurve
+from ecc import curves
 from ecc.keys import ECCKeyPair
 from ecc.ecdsa import ECDSA
 #from ecc_library_path import ECDSA
 
 # Medium teaching curve
-curve = EllipticCurve(
-    p=9739, a=497, b=1768,
-    Gx=1804, Gy=5368,
-    n=9739
-)
+curve = curves.get("toy9739")
 
 def run_weak_k_attack(log):
     log("Attacker forces weak k = 1...")
@@ -1,17 +1,13 @@
 # mitm_tampering.py
 
-from ecc.curve import EllipticCurve
+from ecc import curves
 from ecc.keys import ECCKeyPair
 from ecc.ecdsa import ECDSA
 from logging_config import logger
 
 logger.info("Starting MITM Tampering Simulation…")
 
-curve = EllipticCurve(
-    p=9739, a=497, b=1768,
-    Gx=1804, Gy=5368,
-    n=9929
-)
+curve = curves.get("toy9739")
 
 def run_mitm_tampering(log):
     log("=== MITM TAMPERING ATTACK ===")
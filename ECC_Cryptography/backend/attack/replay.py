@@ -1,6 +1,6 @@
 # replay_attack.py
 
-from ecc.curve import EllipticCurve
+from ecc import curves
 from ecc.keys import ECCKeyPair
 from ecc.ecdsa import ECDSA
 from logging_config import logger
@@ -9,11 +9,7 @@ logger.info("Starting Replay Attack Simulation…")
 
 
 # Teaching curve
-curve = EllipticCurve(
-    p=9739, a=497, b=1768,
-    Gx=1804, Gy=5368,
-    n=9929
-)
+curve = curves.get("toy9739")
 
 
 def run_replay_attack(log):
@@ -1,6 +1,6 @@
 # weak_k_attack.py
 
-from ecc.curve import EllipticCurve
+from ecc import curves
 from ecc.keys import ECCKeyPair
 from ecc.ecdsa import ECDSA
 from logging_config import logger
@@ -8,11 +8,7 @@ from logging_config import logger
 logger.info("Starting Weak‑k Attack Simulation…")
 
 
-curve = EllipticCurve(
-    p=9739, a=497, b=1768,
-    Gx=1804, Gy=5368,
-    n=9929
-)
+curve = curves.get("toy9739")
 
 
 def run_weak_k_attack(log):
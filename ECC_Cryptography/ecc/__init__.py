@@ -1,8 +1,10 @@
 # ecc/__init__.py
 
 from .curve import EllipticCurve, Point
+from . import curves
 from .keys import ECCKeyPair
 from .ecdsa import ECDSA
 from .elgamal import ElGamalECC
-from .encoder import encode_point, decode_point
+from .encoder import encode_point, decode_point, encode_point_compressed, decode_point_compressed
+from .encoder import encode_sig, decode_sig
 from .utils import sha256_int
@@ -0,0 +1,105 @@
+# ecc/aio.py
+"""
+asyncio front end for ECDSA verification.
+
+    verifier = AsyncVerifier(curves.get("secp256k1"))
+    ok = await verifier.verify(msg, sig, Q)
+    ...
+    await verifier.close()
+
+Requests are micro-batched: everything that arrives within max_delay
+seconds (2 ms by default), or as soon as max_batch (256) requests are
+waiting, is sent as one ECDSA.verify_batch call to a process pool with
+run_in_executor. The event loop itself never does a scalar multiplication.
+"""
+
+import asyncio
+from concurrent.futures import ProcessPoolExecutor
+
+from .batch import _curve_spec, _load_curve
+from .curve import Point
+from .ecdsa import ECDSA, Signature
+
+# per-process verifiers, keyed by curve spec
+_verifiers = {}
+
+
+def _verify_chunk(spec, items):
+    """Executor side: rebuild points and signatures, then verify_batch."""
+    ecdsa = _verifiers.get(spec)
+    if ecdsa is None:
+        ecdsa = _verifiers[spec] = ECDSA(_load_curve(spec))
+    curve = ecdsa.curve
+    return ecdsa.verify_batch(
+        (msg, Signature(r, s, recid), Point(x, y, curve)) for msg, (r, s, recid), (x, y) in items
+    )
+
+
+class AsyncVerifier:
+    """
+    Micro-batching ECDSA verifier for coroutines. Pass an executor to share
+    one pool between services; otherwise a ProcessPoolExecutor with
+    `workers` processes is created (and shut down by close()).
+    """
+
+    def __init__(self, curve, max_batch=256, max_delay=0.002, workers=None, executor=None):
+        self.spec = _curve_spec(curve)
+        self.max_batch = max_batch
+        self.max_delay = max_delay
+        self.batches = 0
+        self._own_executor = executor is None
+        self._executor = executor or ProcessPoolExecutor(workers)
+        self._pending = []
+        self._timer = None
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        await self.close()
+
+    async def verify(self, msg, sig, Q) -> bool:
+        """Resolve to True if sig is a valid signature on msg under Q."""
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        # points and signatures travel as plain ints, not pickled curves
+        item = (msg, (sig[0], sig[1], getattr(sig, "recid", None)), (Q.x, Q.y))
+        self._pending.append((item, future))
+
+        if len(self._pending) >= self.max_batch:
+            self._flush()
+        elif self._timer is None:
+            self._timer = loop.call_later(self.max_delay, self._flush)
+        return await future
+
+    def _flush(self):
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        if not self._pending:
+            return
+        batch, self._pending = self._pending, []
+        self.batches += 1
+
+        loop = asyncio.get_running_loop()
+        task = loop.run_in_executor(self._executor, _verify_chunk, self.spec, [item for item, _ in batch])
+
+        def deliver(task):
+            futures = [future for _, future in batch]
+            if task.cancelled() or task.exception() is not None:
+                error = asyncio.CancelledError() if task.cancelled() else task.exception()
+                for future in futures:
+                    if not future.done():
+                        future.set_exception(error)
+                return
+            for future, ok in zip(futures, task.result()):
+                if not future.done():
+                    future.set_result(ok)
+
+        task.add_done_callback(deliver)
+
+    async def close(self):
+        """Send any waiting requests, then shut the owned executor down."""
+        self._flush()
+        if self._own_executor:
+            await asyncio.get_running_loop().run_in_executor(None, self._executor.shutdown)
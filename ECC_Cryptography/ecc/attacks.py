@@ -96,19 +96,11 @@ def demo_k_reuse_attack(curve: EllipticCurve, private_key: int,
 # If run standalone for quick test
 if __name__ == "__main__":
     # minimal demo (requires curve.py and an existing key)
-    from curve import EllipticCurve
-    from keys import ECCKeyPair
+    from ecc import curves
+    from ecc.keys import ECCKeyPair
     import hashlib
 
-    # instantiate secp256k1 parameters
-    curve = EllipticCurve(
-        p=0xFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFEFFFFFC2F,
-        a=0,
-        b=7,
-        Gx=55066263022277343669578718895168534326250603453777594175500187360389116729240,
-        Gy=32670510020758816978083085130507043184471273380659243275938904335757337482424,
-        n=0xFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFEBAAEDCE6AF48A03BBFD25E8CD0364141
-    )
+    curve = curves.get("secp256k1")
 
     kp = ECCKeyPair(curve)
     d, Q = kp.generate_keys()
@@ -0,0 +1,98 @@
+# ecc/batch.py
+"""
+Bulk ECDSA signing across processes.
+
+    from ecc import batch
+    sigs = batch.sign_many(d, messages, curve="secp256k1", workers=8)
+
+    for sig in batch.iter_sign_many(d, huge_message_iterable, workers=8):
+        ...                                   # streamed, in input order
+
+Messages are cut into chunks and signed in a ProcessPoolExecutor. Each
+worker builds its curve (from the ecc.curves registry name) and a
+SigningContext once, in the pool initializer, so the fixed-base table for
+G and the RFC 6979 key state are paid for once per process rather than
+once per chunk. Signatures are deterministic (RFC 6979), so the result is
+the same as signing each message with ECDSA.sign.
+"""
+
+import os
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+
+from . import curves
+from .curve import EllipticCurve
+from .ecdsa import SigningContext
+
+DEFAULT_CHUNK_SIZE = 256
+
+# set in each worker process by _init_worker
+_context = None
+
+
+def _curve_spec(curve):
+    """Something picklable a worker can rebuild the curve from."""
+    if isinstance(curve, str):
+        return curve
+    if curve.name is not None:
+        return curve.name
+    return (curve.p, curve.a, curve.b, curve.G.x, curve.G.y, curve.n)
+
+
+def _load_curve(spec):
+    return curves.get(spec) if isinstance(spec, str) else EllipticCurve(*spec)
+
+
+def _init_worker(spec, private_key):
+    global _context
+    _context = SigningContext(private_key, _load_curve(spec))
+
+
+def _sign_chunk(messages):
+    return [_context.sign(msg) for msg in messages]
+
+
+def _chunks(messages, size):
+    it = iter(messages)
+    while True:
+        chunk = list(islice(it, size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def iter_sign_many(private_key, messages, curve="secp256k1", workers=None,
+                   chunk_size=DEFAULT_CHUNK_SIZE):
+    """
+    Yield a Signature for every message (str or bytes), in input order.
+    messages may be any iterable; at most about 2 * workers chunks are in
+    flight at a time, so very long inputs are not read into memory at once.
+    workers=1 signs in this process.
+    """
+    workers = workers or os.cpu_count() or 1
+    spec = _curve_spec(curve)
+    chunks = _chunks(messages, chunk_size)
+
+    if workers == 1:
+        context = SigningContext(private_key, _load_curve(spec))
+        for chunk in chunks:
+            for msg in chunk:
+                yield context.sign(msg)
+        return
+
+    with ProcessPoolExecutor(workers, initializer=_init_worker,
+                             initargs=(spec, private_key)) as pool:
+        pending = deque()
+        for chunk in chunks:
+            pending.append(pool.submit(_sign_chunk, chunk))
+            if len(pending) >= 2 * workers:
+                yield from pending.popleft().result()
+        while pending:
+            yield from pending.popleft().result()
+
+
+def sign_many(private_key, messages, curve="secp256k1", workers=None,
+              chunk_size=DEFAULT_CHUNK_SIZE):
+    """Signatures for all messages, as a list in input order (see iter_sign_many)."""
+    return list(iter_sign_many(private_key, messages, curve, workers, chunk_size))
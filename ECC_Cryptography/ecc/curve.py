@@ -1,96 +1,852 @@
 # ecc/curve.py
+import math
+from array import array
+
+from .field import get_field
+from .utils import batch_inverse
+
+
+# secp256k1 parameters and its GLV endomorphism constants:
+# (x, y) -> (beta*x, y) equals multiplication by lambda, and (a1, b1), (a2, b2)
+# is a short basis of the lattice {(i, j) : i + j*lambda = 0 mod n}.
+_SECP256K1 = (
+    0xFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFEFFFFFC2F,  # p
+    0,  # a
+    7,  # b
+    0xFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFEBAAEDCE6AF48A03BBFD25E8CD0364141,  # n
+)
+_SECP256K1_GLV = {
+    "beta": 0x7AE96A2B657C07106E64479EAC3434E99CF0497512F58995C1396C28719501EE,
+    "lambda": 0x5363AD4CC05C30E0A5261C028812645A122E22EA20816678DF02967C1B23BD72,
+    "a1": 0x3086D221A7D46BCDE86C90E49284EB15,
+    "b1": -0xE4437ED6010E88286F547FA90ABFE4C3,
+    "a2": 0x114CA50F7A8E2F3F657C1108D9D44CFD8,
+    "b2": 0x3086D221A7D46BCDE86C90E49284EB15,
+}
+
+
+def _wnaf(k, w):
+    """
+    Width-w non-adjacent form of k, least significant digit first.
+    Every non-zero digit is odd with |d| < 2^(w-1), and any w consecutive
+    digits contain at most one non-zero. Negative k gives negated digits.
+    """
+    if k < 0:
+        return [-d for d in _wnaf(-k, w)]
+
+    digits = []
+    half = 1 << (w - 1)
+    full = 1 << w
+    while k:
+        if k & 1:
+            d = k & (full - 1)
+            if d >= half:
+                d -= full
+            k -= d
+            digits.append(d)
+            k >>= 1
+        else:
+            # skip a whole run of zero bits at once
+            zeros = (k & -k).bit_length() - 1
+            digits.extend([0] * zeros)
+            k >>= zeros
+    return digits
+
 
 class Point:
-    """Represents a point on an elliptic curve."""
+    """
+    Represents a point on an elliptic curve.
+
+    Internally the point is kept in Jacobian coordinates (X : Y : Z), which
+    stand for the affine point (X / Z^2, Y / Z^3). Additions and doublings
+    never invert anything; the affine x / y are computed (with a single
+    inversion) only when they are read. Z == 0 is the point at infinity,
+    which is a single shared object per curve (curve.O).
+
+    Points are hashable, so they can be used as dict keys / set members.
+
+    The coordinates live in one tuple, _J, which is only ever replaced as a
+    whole: normalizing computes the affine form from a single read of _J and
+    publishes it with a single assignment, so threads sharing a point never
+    see X, Y and Z from different representations.
+    """
+    __slots__ = ("curve", "_J")
+
+    def __new__(cls, x=None, y=None, curve=None):
+        # Point(None, None, curve) always yields the curve's infinity object
+        if x is None and y is None and curve is not None:
+            O = getattr(curve, "O", None)
+            if O is not None:
+                return O
+        return super().__new__(cls)
+
     def __init__(self, x, y, curve):
-        self.x = x
-        self.y = y
         self.curve = curve  # <-- CRITICAL
+        if x is None and y is None:
+            self._J = (1, 1, 0)
+        else:
+            self._J = (x, y, 1)
+
+    @classmethod
+    def _from_jacobian(cls, J, curve):
+        """Wrap a Jacobian (X, Y, Z) tuple into a Point without normalizing."""
+        if J[2] == 0:
+            return curve.O
+        P = object.__new__(cls)
+        P.curve = curve
+        P._J = tuple(J)
+        return P
+
+    def _jacobian(self):
+        return self._J
+
+    @property
+    def _Z(self):
+        return self._J[2]
+
+    def _normalize(self):
+        """The affine (x, y, 1) form, stored back in place of the Jacobian one."""
+        J = self._J
+        X, Y, Z = J
+        if Z == 0 or Z == 1:
+            return J
+        p = self.curve._p
+        z_inv = self.curve.inverse_mod(Z)
+        z_inv2 = z_inv * z_inv % p
+        J = (X * z_inv2 % p, Y * z_inv2 * z_inv % p, 1)
+        self._J = J
+        return J
+
+    @property
+    def x(self):
+        X, _, Z = self._normalize()
+        return None if Z == 0 else int(X)
+
+    @property
+    def y(self):
+        _, Y, Z = self._normalize()
+        return None if Z == 0 else int(Y)
 
     def __eq__(self, other):
+        if not isinstance(other, Point):
+            return False
+        # same curve object, or an equal copy of it (e.g. from unpickling)
+        if self.curve is not other.curve and self.curve._params() != other.curve._params():
+            return False
+        X1, Y1, Z1 = self._J
+        X2, Y2, Z2 = other._J
+        if Z1 == 0 or Z2 == 0:
+            return Z1 == 0 and Z2 == 0
+
+        # Compare X1/Z1^2 == X2/Z2^2 and Y1/Z1^3 == Y2/Z2^3 without inverting
+        p = self.curve._p
+        z1z1 = Z1 * Z1 % p
+        z2z2 = Z2 * Z2 % p
         return (
-            isinstance(other, Point) and
-            self.x == other.x and self.y == other.y
+            (X1 * z2z2 - X2 * z1z1) % p == 0 and
+            (Y1 * z2z2 * Z2 - Y2 * z1z1 * Z1) % p == 0
         )
 
+    def __hash__(self):
+        # hash the affine form so that equal points hash equally
+        X, Y, Z = self._normalize()
+        return hash((None, None) if Z == 0 else (int(X), int(Y)))
+
+    def __reduce__(self):
+        X, Y, Z = self._normalize()
+        if Z == 0:
+            return (Point, (None, None, self.curve))
+        return (Point, (int(X), int(Y), self.curve))
+
+    def __neg__(self):
+        X, Y, Z = self._J
+        if Z == 0:
+            return self
+        return Point._from_jacobian((X, -Y % self.curve._p, Z), self.curve)
+
     def __repr__(self):
-        if self.x is None and self.y is None:
+        X, Y, Z = self._normalize()
+        if Z == 0:
             return "Point(infinity)"
-        return f"Point({self.x}, {self.y})"
+        return f"Point({int(X)}, {int(Y)})"
 
     # ----------- Point ADDITION -----------
     def __add__(self, Q):
         curve = self.curve
-        p, a = curve.p, curve.a
+
+        P1, P2 = self._J, Q._J
 
         # Point at infinity rules
-        if self.x is None:
+        if P1[2] == 0:
             return Q
-        if Q.x is None:
+        if P2[2] == 0:
             return self
 
-        # If P == -Q → infinity
-        if self.x == Q.x and (self.y + Q.y) % p == 0:
-            return curve.O
-
-        # Slope m
-        if self == Q:
-            # Doubling
-            m = (3 * self.x * self.x + a) * pow(2 * self.y, -1, p)
-            m %= p
+        if P2[2] == 1:
+            R = curve._jadd_mixed(P1, P2)
+        elif P1[2] == 1:
+            R = curve._jadd_mixed(P2, P1)
         else:
-            # Addition
-            m = (Q.y - self.y) * pow(Q.x - self.x, -1, p)
-            m %= p
+            R = curve._jadd(P1, P2)
 
-        # Result coordinates
-        xr = (m * m - self.x - Q.x) % p
-        yr = (m * (self.x - xr) - self.y) % p
+        return Point._from_jacobian(R, curve)
 
-        return Point(xr, yr, curve)
-
-    # ----------- Scalar multiplication (double-and-add) -----------
+    # ----------- Scalar multiplication -----------
     def __rmul__(self, k):
         return self.__mul__(k)
 
     def __mul__(self, k):
-        result = self.curve.O
-        addend = self
+        return self.curve.scalar_mult(k, self)
+
+
+class WnafTable:
+    """
+    Precomputed odd multiples [P, 3P, ..., (2^(w-1) - 1)P] of a point, as
+    Jacobian tuples, plus the GLV image of that table on secp256k1.
+    Build one with curve.wnaf_table(P, w) and pass it to multi_scalar_mult
+    in place of P to reuse the precomputation across calls.
+    """
+    __slots__ = ("point", "width", "table", "phi_table")
+
+    def __init__(self, point, width, table, phi_table=None):
+        self.point = point
+        self.width = width
+        self.table = table
+        self.phi_table = phi_table
 
-        while k > 0:
-            if k & 1:
-                result = result + addend
-            addend = addend + addend
-            k >>= 1
 
-        return result
+def _restore_curve(cls, name, params):
+    """
+    Unpickle a curve: named curves resolve to the shared ecc.curves object
+    (when the registry has the same parameters), so their points compare
+    and share tables with everyone else's; others are rebuilt from params.
+    """
+    if name is not None:
+        from . import curves
+        try:
+            curve = curves.get(name)
+        except KeyError:
+            curve = None
+        if curve is not None and type(curve) is cls and curve._params() == params:
+            return curve
+    curve = cls(*params)
+    curve.name = name
+    return curve
 
 
 class EllipticCurve:
     """Elliptic curve over finite field: y^2 = x^3 + ax + b (mod p)."""
+
+    # window width (bits) of the precomputed fixed-base table for G
+    fixed_base_width = 4
+
+    # window width for wNAF variable-base multiplication, and the scalar
+    # size (bits) from which wNAF is used instead of plain double-and-add
+    window_width = 5
+    wnaf_min_bits = 64
+
+    # below this many terms msm() hands over to Strauss (multi_scalar_mult)
+    msm_strauss_threshold = 32
+
+    # fields with p below this get full lookup tables (field inverses,
+    # k -> k*G and the reverse x -> k index); 0 disables them
+    small_table_limit = 1 << 22
+
     def __init__(self, p, a, b, Gx, Gy, n):
         self.p = p
         self.a = a
         self.b = b
         self.n = n
+        self.name = None  # set by the ecc.curves registry
+
+        # field arithmetic backend (gmpy2 or pure Python, see ecc.field);
+        # the Jacobian formulas reduce modulo the backend's copy of p
+        self.field = get_field(p)
+        self._p = self.field.p
 
         # generator and infinity point
         self.G = Point(Gx, Gy, self)
         self.O = Point(None, None, self)
 
+        # fixed-base table for G, built lazily on first use
+        self._g_table = None
+        self._g_table_base = None
+        self._g_wnaf_table = None
+
+        # ecdsa.VerificationCache shared by verifiers on this curve, see
+        # VerificationCache.for_curve
+        self._verify_cache = None
+
+        # full lookup tables for small fields, built lazily on first use;
+        # False means the field is too large (or G has no usable table)
+        small = p < self.small_table_limit
+        self._inv_table = None if small else False
+        self._small = None if small else False
+
+        # GLV endomorphism, only for secp256k1
+        if (p, a % p, b % p, n) == _SECP256K1:
+            self._glv = _SECP256K1_GLV
+        else:
+            self._glv = None
+
+        # pick the cheapest doubling formula for this curve's a
+        if a % p == 0:
+            self._jdouble = self._jdouble_a0
+        elif a % p == p - 3:
+            self._jdouble = self._jdouble_a3
+        else:
+            self._jdouble = self._jdouble_generic
+
+    def _params(self):
+        """(p, a, b, Gx, Gy, n), the constructor arguments."""
+        return (self.p, self.a, self.b, self.G.x, self.G.y, self.n)
+
+    def __reduce__(self):
+        # pickle by parameters (plus the registry name), not the lazily
+        # built tables
+        return (_restore_curve, (type(self), self.name, self._params()))
+
     # ----------- Modular inverse helper -----------
     def inverse_mod(self, k):
         """Modular inverse of k modulo p."""
         if k == 0:
             raise ZeroDivisionError("Cannot invert 0 in modular arithmetic.")
-        return pow(k, -1, self.p)
+        table = self._inv_table
+        if table is None:
+            table = self._inv_table = self._build_inv_table()
+        if table is False:
+            return self.field.inv(k)
+        k_inv = table[k % self.p]
+        if k_inv == 0:
+            raise ZeroDivisionError("Cannot invert 0 in modular arithmetic.")
+        return k_inv
+
+    # ----------- Small-field lookup tables -----------
+    def _build_inv_table(self):
+        """Inverses of 0..p-1 (inv[0] = 0) via inv[i] = -(p // i) * inv[p % i]."""
+        p = self.p
+        inv = array("i", bytes(4 * p))
+        if p > 1:
+            inv[1] = 1
+        for i in range(2, p):
+            inv[i] = -(p // i) * inv[p % i] % p
+        return inv
+
+    def _build_small_tables(self):
+        """
+        Walk G, 2G, 3G, ... in affine coordinates until it wraps around to
+        infinity. Returns (order, xs, ys, index) where (xs[k], ys[k]) = k*G for
+        0 < k < order, and index[x] is the smallest k with (k*G).x == x or -1.
+        order is the true order of G, whatever n says. Returns False if no
+        cycle shows up within the Hasse bound (G not on a proper curve).
+        """
+        p, a = self.p, self.a
+        if self._inv_table is None:
+            self._inv_table = self._build_inv_table()
+        inv = self._inv_table
+        gx, gy = self.G.x, self.G.y
+        bound = p + 2 * math.isqrt(p) + 2
+
+        xs, ys = array("i", [0]), array("i", [0])
+        x, y = gx, gy
+        while True:
+            xs.append(x)
+            ys.append(y)
+            if x == gx:
+                if (y + gy) % p == 0:  # next multiple is infinity
+                    break
+                lam = (3 * x * x + a) * inv[2 * y % p] % p
+            else:
+                lam = (y - gy) * inv[(x - gx) % p] % p
+            x3 = (lam * lam - x - gx) % p
+            y = (lam * (x - x3) - y) % p
+            x = x3
+            if len(xs) > bound:
+                return False
+
+        order = len(xs)
+        index = array("i", [-1]) * p
+        for k in range(1, order):
+            if index[xs[k]] < 0:
+                index[xs[k]] = k
+        return order, xs, ys, index
+
+    def _small_tables(self):
+        tables = self._small
+        if tables is None:
+            tables = self._small = self._build_small_tables()
+        return tables
+
+    def _small_log(self, P, tables):
+        """k with k*G == P from the reverse index, or None."""
+        if P is self.G:
+            return 1
+        order, _, ys, index = tables
+        x, y = P.x % self.p, P.y % self.p
+        k = index[x]
+        if k < 0:
+            return None
+        if ys[k] == y:
+            return k
+        if (ys[k] + y) % self.p == 0:
+            return order - k
+        return None
+
+    def _small_mult(self, k, P):
+        """k*P by table lookup, or None if P is not a multiple of G."""
+        tables = self._small_tables()
+        if not tables:
+            return None
+        j = self._small_log(P, tables)
+        if j is None:
+            return None
+        order, xs, ys, _ = tables
+        k = k * j % order
+        if k == 0:
+            return self.O
+        return Point(xs[k], ys[k], self)
+
+    def discrete_log(self, Q):
+        """
+        k with k*G == Q (0 <= k < order of G) looked up in the small-field
+        tables, or None if Q is not a multiple of G. Only for p below
+        small_table_limit; see ecc.dlp for larger curves.
+        """
+        tables = self._small_tables() if self._small is not False else False
+        if not tables:
+            raise ValueError("No lookup tables for this curve; use ecc.dlp.pollard_rho")
+        if Q._Z == 0:
+            return 0
+        return self._small_log(Q, tables)
+
+    # ----------- Batch normalization -----------
+    def batch_normalize(self, points):
+        """
+        Convert points to affine (Z = 1) in place with a single shared
+        inversion, and return them as a list.
+        """
+        points = list(points)
+        # read each point's coordinates once; another thread may normalize
+        # the same point meanwhile, but it can only publish the same value
+        pending = [(P, P._J) for P in points]
+        pending = [(P, J) for P, J in pending if J[2] not in (0, 1)]
+        if not pending:
+            return points
+
+        p = self._p
+        for (P, (X, Y, Z)), z_inv in zip(pending, batch_inverse([J[2] for _, J in pending], p)):
+            z_inv2 = z_inv * z_inv % p
+            P._J = (X * z_inv2 % p, Y * z_inv2 * z_inv % p, 1)
+        return points
+
+    # ----------- Jacobian coordinate formulas -----------
+    # Points are (X, Y, Z) tuples standing for (X/Z^2, Y/Z^3); Z == 0 is infinity.
+    # None of these invert anything.
+
+    def _jdouble_a0(self, P):
+        """Doubling for a = 0 (e.g. secp256k1)."""
+        X, Y, Z = P
+        p = self._p
+        YY = Y * Y % p
+        S = 4 * X * YY % p
+        M = 3 * X * X % p
+        X3 = (M * M - 2 * S) % p
+        Y3 = (M * (S - X3) - 8 * YY * YY) % p
+        Z3 = 2 * Y * Z % p
+        return (X3, Y3, Z3)
+
+    def _jdouble_a3(self, P):
+        """Doubling for a = -3 (e.g. P-256): M = 3(X - Z^2)(X + Z^2)."""
+        X, Y, Z = P
+        p = self._p
+        ZZ = Z * Z % p
+        YY = Y * Y % p
+        S = 4 * X * YY % p
+        M = 3 * (X - ZZ) * (X + ZZ) % p
+        X3 = (M * M - 2 * S) % p
+        Y3 = (M * (S - X3) - 8 * YY * YY) % p
+        Z3 = 2 * Y * Z % p
+        return (X3, Y3, Z3)
+
+    def _jdouble_generic(self, P):
+        """Doubling for arbitrary a: M = 3X^2 + aZ^4."""
+        X, Y, Z = P
+        p = self._p
+        ZZ = Z * Z % p
+        YY = Y * Y % p
+        S = 4 * X * YY % p
+        M = (3 * X * X + self.a * ZZ * ZZ) % p
+        X3 = (M * M - 2 * S) % p
+        Y3 = (M * (S - X3) - 8 * YY * YY) % p
+        Z3 = 2 * Y * Z % p
+        return (X3, Y3, Z3)
+
+    def _jadd(self, P, Q):
+        """General Jacobian addition P + Q."""
+        X1, Y1, Z1 = P
+        X2, Y2, Z2 = Q
+        if Z1 == 0:
+            return Q
+        if Z2 == 0:
+            return P
+
+        p = self._p
+        Z1Z1 = Z1 * Z1 % p
+        Z2Z2 = Z2 * Z2 % p
+        U1 = X1 * Z2Z2 % p
+        U2 = X2 * Z1Z1 % p
+        S1 = Y1 * Z2 * Z2Z2 % p
+        S2 = Y2 * Z1 * Z1Z1 % p
+        H = (U2 - U1) % p
+        R = (S2 - S1) % p
+
+        if H == 0:
+            # Same x: either P == Q (double) or P == -Q (infinity)
+            if R == 0:
+                return self._jdouble(P)
+            return (1, 1, 0)
+
+        HH = H * H % p
+        HHH = H * HH % p
+        V = U1 * HH % p
+        X3 = (R * R - HHH - 2 * V) % p
+        Y3 = (R * (V - X3) - S1 * HHH) % p
+        Z3 = Z1 * Z2 * H % p
+        return (X3, Y3, Z3)
+
+    def _jadd_mixed(self, P, Q):
+        """Mixed addition P + Q where Q is affine (Z = 1)."""
+        X1, Y1, Z1 = P
+        X2, Y2, _ = Q
+        if Z1 == 0:
+            return Q
+
+        p = self._p
+        Z1Z1 = Z1 * Z1 % p
+        U2 = X2 * Z1Z1 % p
+        S2 = Y2 * Z1 * Z1Z1 % p
+        H = (U2 - X1) % p
+        R = (S2 - Y1) % p
+
+        if H == 0:
+            if R == 0:
+                return self._jdouble(P)
+            return (1, 1, 0)
+
+        HH = H * H % p
+        HHH = H * HH % p
+        V = X1 * HH % p
+        X3 = (R * R - HHH - 2 * V) % p
+        Y3 = (R * (V - X3) - Y1 * HHH) % p
+        Z3 = Z1 * H % p
+        return (X3, Y3, Z3)
 
     # ----------- Point addition helper -----------
     def point_add(self, P, Q):
         """Add two points P and Q on the curve."""
         return P + Q
 
+    # ----------- Fixed-base precomputation for G -----------
+    def _build_g_table(self):
+        """
+        Build the 2^w-ary table for G: row i holds j * 2^(w*i) * G for
+        j = 1 .. 2^w - 1, in affine form so lookups can use mixed additions.
+        Rows cover scalars up to the bit length of n.
+        """
+        w = self.fixed_base_width
+        rows = (max(self.n.bit_length(), 1) + w - 1) // w
+
+        table = []
+        base = self.G._jacobian()
+        for _ in range(rows):
+            row = [None]
+            J = base
+            for _ in range(1, 1 << w):
+                row.append(Point._from_jacobian(J, self))
+                J = self._jadd(J, base)
+            self.batch_normalize(row[1:])
+            table.append(row)
+            base = J  # 2^w * base
+
+        self._g_table = table
+        self._g_table_base = self.G
+        return table
+
+    def fixed_base_table(self):
+        """
+        The fixed-base table for G used by scalar_mult, built on first use
+        (and rebuilt if G has been replaced). Call it up front to keep the
+        one-off cost out of the first multiplication.
+        """
+        table = self._g_table
+        if table is None or self._g_table_base is not self.G:
+            table = self._build_g_table()
+        return table
+
+    def _fixed_base_mult(self, k):
+        """k * G using only table lookups and mixed additions (no doublings)."""
+        w = self.fixed_base_width
+        mask = (1 << w) - 1
+        R = (1, 1, 0)
+        for row in self.fixed_base_table():
+            digit = k & mask
+            if digit:
+                T = row[digit]._J
+                if T[2]:
+                    R = self._jadd_mixed(R, T)
+            k >>= w
+
+        return Point._from_jacobian(R, self)
+
+    # ----------- wNAF variable-base multiplication -----------
+    def _odd_multiples(self, J, w):
+        """[P, 3P, 5P, ..., (2^(w-1) - 1)P] for Jacobian P, as affine Points."""
+        P2 = self._jdouble(J)
+        table = [Point._from_jacobian(J, self)]
+        for _ in range((1 << (w - 2)) - 1):
+            table.append(Point._from_jacobian(self._jadd(table[-1]._jacobian(), P2), self))
+        return self.batch_normalize(table)
+
+    def _strauss(self, terms):
+        """
+        Evaluate sum(k_i * P_i) from (wnaf_digits, odd_multiples) terms,
+        interleaving all of them over a single shared doubling chain.
+        Returns a Jacobian tuple.
+        """
+        p = self._p
+
+        # Lay out, per bit position, the (signed) table entries to add there
+        schedule = [None] * max(len(naf) for naf, _ in terms)
+        for naf, table in terms:
+            for i, d in enumerate(naf):
+                if d == 0:
+                    continue
+                if d > 0:
+                    T = table[d >> 1]
+                else:
+                    X, Y, Z = table[(-d) >> 1]
+                    T = (X, -Y % p, Z)
+                if schedule[i] is None:
+                    schedule[i] = [T]
+                else:
+                    schedule[i].append(T)
+
+        R = (1, 1, 0)
+        for adds in reversed(schedule):
+            R = self._jdouble(R)
+            if adds:
+                for T in adds:
+                    R = self._jadd_mixed(R, T) if T[2] == 1 else self._jadd(R, T)
+        return R
+
+    def _glv_split(self, k):
+        """
+        Split k into (k1, k2) with k = k1 + k2*lambda (mod n) and
+        |k1|, |k2| around sqrt(n), by rounding k onto the GLV lattice.
+        """
+        glv = self._glv
+        n = self.n
+        k %= n
+        c1 = (glv["b2"] * k + n // 2) // n
+        c2 = (-glv["b1"] * k + n // 2) // n
+        k1 = k - c1 * glv["a1"] - c2 * glv["a2"]
+        k2 = -c1 * glv["b1"] - c2 * glv["b2"]
+        return k1, k2
+
+    def _phi_table(self, table):
+        """phi(P)'s odd-multiples table: beta times the x-coordinates of P's."""
+        p = self._p
+        beta = self._glv["beta"]
+        return [(beta * X % p, Y, Z) for X, Y, Z in table]
+
+    def _wnaf_terms(self, k, table, phi_table=None):
+        """
+        Strauss terms for k * P, given P's odd-multiples table (whose length
+        2^(w-2) fixes the window width w). On secp256k1 k is split with the
+        GLV endomorphism into two half-length scalars.
+        """
+        w = len(table).bit_length() + 1
+        if self._glv is None:
+            return [(_wnaf(k, w), table)]
+
+        k1, k2 = self._glv_split(k)
+        if phi_table is None:
+            phi_table = self._phi_table(table)
+        return [(_wnaf(k1, w), table), (_wnaf(k2, w), phi_table)]
+
+    def _wnaf_mult(self, k, J):
+        """k * P for Jacobian P using width-w NAF recoding."""
+        table = [T._jacobian() for T in self._odd_multiples(J, self.window_width)]
+        return self._strauss(self._wnaf_terms(k, table))
+
+    def _g_odd_multiples(self):
+        """Odd-multiples table for G, cached like the fixed-base table."""
+        w = self.window_width
+        cached = self._g_wnaf_table
+        if cached is None or cached[0] is not self.G or cached[1] != w:
+            table = [T._jacobian() for T in self._odd_multiples(self.G._jacobian(), w)]
+            cached = self._g_wnaf_table = (self.G, w, table)
+        return cached[2]
+
+    def wnaf_table(self, P, w=None):
+        """
+        Precompute P's wNAF table (window w, default window_width) for
+        repeated use in multi_scalar_mult; wider windows cost more up front
+        and save additions on every later multiplication.
+        """
+        w = w or self.window_width
+        table = [T._jacobian() for T in self._odd_multiples(P._jacobian(), w)]
+        phi_table = self._phi_table(table) if self._glv is not None else None
+        return WnafTable(P, w, table, phi_table)
+
+    # ----------- Multi-scalar multiplication -----------
+    def multi_scalar_mult(self, pairs):
+        """
+        Compute sum(k_i * P_i) for an iterable of (k, P) pairs; P may also be
+        a WnafTable from wnaf_table().
+        Uses Strauss-Shamir interleaved wNAF: the terms share one doubling
+        chain, so u1*G + u2*Q costs about as many doublings as one multiply
+        (half of that on secp256k1, where every scalar is GLV-split).
+        """
+        if self._small is not False:
+            pairs = [(k, P.point if isinstance(P, WnafTable) else P) for k, P in pairs]
+            tables = self._small_tables()
+            if tables:
+                logs = [(k, self._small_log(P, tables)) for k, P in pairs if P._Z != 0]
+                if all(j is not None for _, j in logs):
+                    return self._small_mult(sum(k * j for k, j in logs), self.G)
+
+        w = self.window_width
+        terms = []
+        for k, P in pairs:
+            if isinstance(P, WnafTable):
+                if k:
+                    terms.extend(self._wnaf_terms(k, P.table, P.phi_table))
+                continue
+            if k == 0 or P._Z == 0:
+                continue
+            if P is self.G:
+                table = self._g_odd_multiples()
+            else:
+                table = [T._jacobian() for T in self._odd_multiples(P._jacobian(), w)]
+            terms.extend(self._wnaf_terms(k, table))
+
+        if not terms:
+            return self.O
+        R = self._strauss(terms)
+        return Point._from_jacobian(R, self)
+
+    # ----------- Pippenger bucket MSM -----------
+    @staticmethod
+    def _msm_window(num_terms, bits):
+        """Bucket width c minimizing (bits / c) * (num_terms + 2^(c+1)) additions."""
+        best_c, best_cost = 1, None
+        for c in range(1, 21):
+            cost = -(-bits // c) * (num_terms + (1 << (c + 1)))
+            if best_cost is None or cost < best_cost:
+                best_c, best_cost = c, cost
+        return best_c
+
+    def msm(self, scalars, points):
+        """
+        Compute sum(scalars[i] * points[i]) for many terms.
+        Uses Pippenger's bucket method with an automatically chosen window
+        and falls back to Strauss for fewer than msm_strauss_threshold terms.
+        """
+        scalars = list(scalars)
+        points = list(points)
+        if len(scalars) != len(points):
+            raise ValueError("scalars and points must have the same length")
+
+        pairs = [(k, P) for k, P in zip(scalars, points) if k and P._Z != 0]
+        if len(pairs) < self.msm_strauss_threshold:
+            return self.multi_scalar_mult(pairs)
+
+        # affine inputs let the bucket additions use the mixed formula
+        self.batch_normalize(P for _, P in pairs)
+
+        # Make every scalar non-negative (negating its point instead); on
+        # secp256k1 also GLV-split it into two half-length scalars.
+        p = self._p
+        terms = []
+        for k, P in pairs:
+            J = P._jacobian()
+            if self._glv is None:
+                halves = [(k, J)]
+            else:
+                X, Y, Z = J
+                k1, k2 = self._glv_split(k)
+                halves = [(k1, J), (k2, (self._glv["beta"] * X % p, Y, Z))]
+            for k_i, (X, Y, Z) in halves:
+                if k_i < 0:
+                    k_i, Y = -k_i, -Y % p
+                if k_i:
+                    terms.append((k_i, (X, Y, Z)))
+
+        if not terms:
+            return self.O
+
+        bits = max(k for k, _ in terms).bit_length()
+        c = self._msm_window(len(terms), bits)
+        mask = (1 << c) - 1
+        infinity = (1, 1, 0)
+
+        R = infinity
+        for shift in range(((bits + c - 1) // c - 1) * c, -1, -c):
+            for _ in range(c):
+                R = self._jdouble(R)
+
+            # Drop each point into the bucket of its current window digit
+            buckets = [None] * (mask + 1)
+            for k, J in terms:
+                d = (k >> shift) & mask
+                if d:
+                    B = buckets[d]
+                    if B is None:
+                        buckets[d] = J
+                    elif J[2] == 1:
+                        buckets[d] = self._jadd_mixed(B, J)
+                    else:
+                        buckets[d] = self._jadd(B, J)
+
+            # sum(d * bucket[d]) via running sums from the top bucket down
+            running = infinity
+            window_sum = infinity
+            for d in range(mask, 0, -1):
+                if buckets[d] is not None:
+                    running = self._jadd(running, buckets[d])
+                window_sum = self._jadd(window_sum, running)
+            R = self._jadd(R, window_sum)
+
+        return Point._from_jacobian(R, self)
+
     # ----------- Scalar multiplication helper -----------
     def scalar_mult(self, k, P):
-        """Multiply point P by scalar k using double-and-add."""
-        return k * P
+        """
+        Multiply point P by scalar k.
+        Uses the precomputed fixed-base table when P is the generator,
+        wNAF for large scalars, otherwise left-to-right double-and-add.
+        """
+        if k <= 0 or P._Z == 0:
+            return self.O
+
+        if self._small is not False:
+            R = self._small_mult(k, P)
+            if R is not None:
+                return R
+
+        if P is self.G and k.bit_length() <= max(self.n.bit_length(), 1):
+            return self._fixed_base_mult(k)
+
+        J = P._jacobian()
+        if k.bit_length() >= self.wnaf_min_bits:
+            return Point._from_jacobian(self._wnaf_mult(k, J), self)
+
+        add = self._jadd_mixed if J[2] == 1 else self._jadd
+        R = J
+        for bit in bin(k)[3:]:
+            R = self._jdouble(R)
+            if bit == "1":
+                R = add(R, J)
+
+        return Point._from_jacobian(R, self)
@@ -0,0 +1,604 @@
+# ecc/curvegen.py
+"""
+Random curve generation for the attack demos and cost sweeps.
+
+generate_curve(bits) returns an EllipticCurve over a random `bits`-bit prime
+field whose group order is prime (or prime times a small cofactor), with G
+generating the prime-order subgroup and n its order.
+
+Point counting:
+- count_points_bsgs: Mestre's baby-step giant-step search of the Hasse
+  interval, O(p^(1/4)) group operations. Used below SCHOOF_MIN_BITS.
+- count_points_schoof: Schoof's algorithm. t mod l is read off the
+  l-division polynomials for small primes l and combined by CRT. Used for
+  larger fields (roughly 40-128 bits).
+
+Generated curves and point counts are cached in a JSON file
+(ECC_CURVE_CACHE, default ~/.cache/ecc_curvegen.json).
+
+    python -m ecc.curvegen 48
+"""
+
+import json
+import os
+import random
+from itertools import zip_longest
+from math import isqrt
+
+from .curve import EllipticCurve, Point
+from .field import PythonField
+
+# fields of at least this many bits are counted with Schoof instead of BSGS
+SCHOOF_MIN_BITS = 40
+
+CACHE_PATH = os.environ.get(
+    "ECC_CURVE_CACHE", os.path.join(os.path.expanduser("~"), ".cache", "ecc_curvegen.json")
+)
+
+_SMALL_PRIMES = [2, 3, 5, 7, 11, 13, 17, 19, 23, 29, 31, 37, 41]
+
+
+# ----------- Primes -----------
+def is_probable_prime(n, rounds=16):
+    """Miller-Rabin; deterministic below 3.3 * 10^24."""
+    if n < 2:
+        return False
+    for q in _SMALL_PRIMES:
+        if n % q == 0:
+            return n == q
+
+    d, s = n - 1, 0
+    while d % 2 == 0:
+        d //= 2
+        s += 1
+
+    bases = list(_SMALL_PRIMES)
+    if n >= 3317044064679887385961981:
+        bases += [random.randrange(2, n - 1) for _ in range(rounds)]
+    for base in bases:
+        x = pow(base, d, n)
+        if x in (1, n - 1):
+            continue
+        for _ in range(s - 1):
+            x = x * x % n
+            if x == n - 1:
+                break
+        else:
+            return False
+    return True
+
+
+def random_prime(bits, rng=random):
+    """Random prime with exactly `bits` bits."""
+    while True:
+        candidate = rng.getrandbits(bits) | (1 << (bits - 1)) | 1
+        if is_probable_prime(candidate):
+            return candidate
+
+
+def _next_prime(n):
+    n += 1
+    while not is_probable_prime(n):
+        n += 1
+    return n
+
+
+# ----------- Small helpers -----------
+class _ScratchCurve(EllipticCurve):
+    """Throwaway curve for point counting: never builds small-field lookup tables."""
+
+    small_table_limit = 0
+
+
+def _random_point(p, a, b, rng):
+    """Random affine (x, y) on y^2 = x^3 + ax + b over F_p."""
+    F = PythonField(p)
+    while True:
+        x = rng.randrange(p)
+        y = F.sqrt((x * x * x + a * x + b) % p)
+        if y is not None:
+            return x, (y if rng.getrandbits(1) else -y % p)
+
+
+def count_points_naive(p, a, b):
+    """#E(F_p) = p + 1 + sum of Legendre symbols; O(p) and only for tiny p."""
+    total = p + 1
+    for x in range(p):
+        rhs = (x * x * x + a * x + b) % p
+        if rhs == 0:
+            continue
+        total += 1 if pow(rhs, (p - 1) // 2, p) == 1 else -1
+    return total
+
+
+# ----------- Baby-step giant-step -----------
+def _orders_in_interval(p, a, b, point, lo, hi):
+    """
+    All m in [lo, hi] with m * P = O, via baby-step giant-step.
+    Returns None if P has order below the baby-step count (pick another P).
+    """
+    curve = _ScratchCurve(p, a, b, point[0], point[1], 1)
+    P = curve.G
+    s = isqrt(hi - lo + 1) + 1
+
+    # baby steps j*P, 1 <= j < s, keyed by affine coordinates
+    multiples = [P]
+    for _ in range(s - 2):
+        multiples.append(multiples[-1] + P)
+    if any(Q is curve.O for Q in multiples):
+        return None
+    curve.batch_normalize(multiples)
+    baby = {(Q.x, Q.y): j for j, Q in enumerate(multiples, 1)}
+    if len(baby) < len(multiples):
+        return None
+
+    # giant steps R_i = (lo + i*s) * P; m*P = O  <=>  R_i = -(j*P)
+    step = curve.scalar_mult(s, P)
+    giants = [curve.scalar_mult(lo, P)]
+    for _ in range((hi - lo) // s + 1):
+        giants.append(giants[-1] + step)
+    curve.batch_normalize(giants)
+
+    found = []
+    for i, R in enumerate(giants):
+        m0 = lo + i * s
+        if R is curve.O:
+            found.append(m0)
+            continue
+        j = baby.get((R.x, -R.y % p))
+        if j is not None:
+            found.append(m0 + j)
+    return [m for m in found if lo <= m <= hi]
+
+
+def _hasse_candidates(p, a, b, rng, points=8):
+    """Group orders in the Hasse interval consistent with `points` random points."""
+    root = isqrt(4 * p) + 1
+    lo, hi = max(1, p + 1 - root), p + 1 + root
+    candidates = None
+    for _ in range(points):
+        found = _orders_in_interval(p, a, b, _random_point(p, a, b, rng), lo, hi)
+        if found is None:
+            continue
+        candidates = set(found) if candidates is None else candidates & set(found)
+        if len(candidates) == 1:
+            break
+    return candidates
+
+
+def count_points_bsgs(p, a, b, rng=random):
+    """
+    #E(F_p) by baby-step giant-step over the Hasse interval.
+    Candidate orders from several random points are intersected; if the
+    group structure leaves several candidates, the quadratic twist
+    (whose order is 2p + 2 - #E) settles it.
+    """
+    if p < 1 << 10:
+        return count_points_naive(p, a, b)
+
+    candidates = _hasse_candidates(p, a, b, rng)
+    if candidates is None or len(candidates) != 1:
+        d = 2
+        while pow(d, (p - 1) // 2, p) == 1:
+            d += 1
+        twist = _hasse_candidates(p, a * d * d % p, b * d * d * d % p, rng)
+        if twist is not None:
+            from_twist = {2 * p + 2 - m for m in twist}
+            candidates = from_twist if candidates is None else candidates & from_twist
+
+    if not candidates or len(candidates) != 1:
+        raise RuntimeError(f"Could not determine the group order of y^2 = x^3 + {a}x + {b} mod {p}")
+    return candidates.pop()
+
+
+# ----------- Polynomials over F_p (Kronecker-substitution multiplication) -----------
+def _trim(A):
+    while A and A[-1] == 0:
+        A.pop()
+    return A
+
+
+def _poly_add(A, B, p):
+    return [(x + y) % p for x, y in zip_longest(A, B, fillvalue=0)]
+
+
+def _poly_sub(A, B, p):
+    return [(x - y) % p for x, y in zip_longest(A, B, fillvalue=0)]
+
+
+def _poly_scale(A, c, p):
+    return [x * c % p for x in A]
+
+
+def _poly_mul(A, B, p):
+    """
+    Full product of two coefficient lists (low degree first).
+    Both are packed into one big integer each, so the work is done by
+    Python's big-integer multiplication instead of an O(n^2) Python loop.
+    """
+    if not A or not B:
+        return []
+    slot = (2 * p.bit_length() + min(len(A), len(B)).bit_length() + 8) // 8
+    pa = int.from_bytes(b"".join(c.to_bytes(slot, "little") for c in A), "little")
+    pb = int.from_bytes(b"".join(c.to_bytes(slot, "little") for c in B), "little")
+    n = len(A) + len(B) - 1
+    raw = (pa * pb).to_bytes(n * slot, "little")
+    return [int.from_bytes(raw[i:i + slot], "little") % p for i in range(0, n * slot, slot)]
+
+
+def _poly_divmod(A, B, p):
+    """Schoolbook (quotient, remainder) of A by B over F_p."""
+    A = _trim(list(A))
+    B = _trim(list(B))
+    if len(A) < len(B):
+        return [], A
+    inv_lead = pow(B[-1], -1, p)
+    Q = [0] * (len(A) - len(B) + 1)
+    for i in range(len(A) - len(B), -1, -1):
+        c = A[i + len(B) - 1] * inv_lead % p
+        Q[i] = c
+        if c:
+            for j, bj in enumerate(B):
+                A[i + j] = (A[i + j] - c * bj) % p
+    return Q, _trim(A[:len(B) - 1])
+
+
+def _poly_gcd(A, B, p):
+    """Monic gcd over F_p."""
+    A, B = _trim(list(A)), _trim(list(B))
+    while B:
+        A, B = B, _poly_divmod(A, B, p)[1]
+    if not A:
+        return A
+    return _poly_scale(A, pow(A[-1], -1, p), p)
+
+
+class _PolyMod:
+    """
+    Arithmetic in F_p[x] / (h) for monic h, with Barrett-style reduction.
+    h=None gives plain F_p[x] (no reduction).
+    """
+
+    def __init__(self, h, p):
+        self.p = p
+        self.h = h
+        if h is None:
+            return
+        self.d = len(h) - 1
+        # power series inverse of reverse(h) mod x^d, by Newton iteration
+        rev = h[::-1]
+        inv, prec = [1], 1
+        while prec < self.d:
+            prec = min(2 * prec, self.d)
+            e = _poly_mul(rev[:prec], inv, p)[:prec]
+            e = [(-c) % p for c in e]
+            e[0] = (e[0] + 2) % p
+            inv = _poly_mul(inv, e, p)[:prec]
+        self.hinv = inv
+
+    def reduce(self, C):
+        C = _trim(list(C))
+        if self.h is None:
+            return C
+        p, d = self.p, self.d
+        while len(C) > 2 * d - 1:  # only for inputs not coming from mul()
+            C = _poly_divmod(C, self.h, p)[1]
+        if len(C) <= d:
+            return C
+        m = len(C) - d  # number of quotient coefficients
+        rev_q = _poly_mul(C[::-1][:m], self.hinv[:m], p)[:m]
+        qh = _poly_mul(rev_q[::-1], self.h, p)
+        return [(c - q) % p for c, q in zip_longest(C[:d], qh[:d], fillvalue=0)]
+
+    def mul(self, A, B):
+        return self.reduce(_poly_mul(A, B, self.p))
+
+    def pow(self, A, e):
+        result = [1]
+        for bit in bin(e)[2:]:
+            result = self.mul(result, result)
+            if bit == "1":
+                result = self.mul(result, A)
+        return result
+
+    def is_zero(self, A):
+        return not any(self.reduce(A))
+
+
+def _division_polys(R, X, F, count, a, b):
+    """
+    f_0 .. f_count at x = X (a residue mod h) where y^2 = F.
+    f_n = psi_n for odd n and psi_n / (2y) for even n, so every f_n is a
+    polynomial in x. Uses the standard doubling recurrences with 16 F^2 in
+    place of (2y)^4.
+    """
+    p = R.p
+    mul = R.mul
+
+    # f_3 = 3x^4 + 6ax^2 + 12bx - a^2
+    # f_4 = 2(x^6 + 5ax^4 + 20bx^3 - 5a^2x^2 - 4abx - 8b^2 - a^3)
+    powers = [[1], X]
+    for _ in range(5):
+        powers.append(mul(powers[-1], X))
+
+    def poly_at_X(coeffs):
+        total = []
+        for c, Xi in zip(coeffs, powers):
+            if c % p:
+                total = _poly_add(total, _poly_scale(Xi, c, p), p)
+        return total
+
+    f3 = poly_at_X([-a * a, 12 * b, 6 * a, 0, 3])
+    f4 = poly_at_X([2 * (-8 * b * b - a * a * a), -8 * a * b, -10 * a * a, 40 * b, 10 * a, 0, 2])
+    FF = _poly_scale(mul(F, F), 16, p)
+
+    fs = [[], [1], [1], f3, f4]
+    for n in range(5, count + 1):
+        m = n // 2
+        if n % 2:
+            left = mul(fs[m + 2], mul(fs[m], mul(fs[m], fs[m])))
+            right = mul(fs[m - 1], mul(fs[m + 1], mul(fs[m + 1], fs[m + 1])))
+            if m % 2:
+                right = mul(FF, right)
+            else:
+                left = mul(FF, left)
+            fs.append(_poly_sub(left, right, p))
+        else:
+            inner = _poly_sub(mul(fs[m + 2], mul(fs[m - 1], fs[m - 1])),
+                              mul(fs[m - 2], mul(fs[m + 1], fs[m + 1])), p)
+            fs.append(mul(fs[m], inner))
+    return fs[:count + 1]
+
+
+def _multiple(R, fs, j, X, F):
+    """
+    j * (x, y) as fractions ((Xn, Xd), (Yn, Yd)) where the y-coordinate is
+    y * Yn / Yd, from the division polynomials fs (evaluated at X, y^2 = F).
+    """
+    p = R.p
+    mul = R.mul
+
+    def f(i):
+        return _poly_scale(fs[-i], -1, p) if i < 0 else fs[i]
+
+    fj2 = mul(f(j), f(j))
+    outer = mul(f(j - 1), f(j + 1))
+    Yn = _poly_sub(mul(f(j + 2), mul(f(j - 1), f(j - 1))),
+                   mul(f(j - 2), mul(f(j + 1), f(j + 1))), p)
+    if j % 2:
+        Xd = fj2
+        Xn = _poly_sub(mul(X, fj2), _poly_scale(mul(F, outer), 4, p), p)
+        Yd = mul(fj2, f(j))
+    else:
+        Xd = _poly_scale(mul(F, fj2), 4, p)
+        Xn = _poly_sub(mul(X, Xd), outer, p)
+        Yd = _poly_scale(mul(mul(F, F), mul(fj2, f(j))), 16, p)
+    return (Xn, Xd), (Yn, Yd)
+
+
+class _Split(Exception):
+    """Raised with a proper Frobenius-stable factor of the current modulus."""
+    def __init__(self, factor):
+        super().__init__()
+        self.factor = factor
+
+
+def _trace_mod_l_on(h, p, a, b, l):
+    """
+    t mod l using the l-torsion points whose x-coordinates are roots of h.
+    Inversion-free: every comparison is done on cross-multiplied fractions.
+    """
+    R = _PolyMod(h, p)
+    mul = R.mul
+    q = p % l
+    x = R.reduce([0, 1])
+    f = R.reduce([b % p, a % p, 0, 1])
+
+    # Frobenius: x^p, y^p = y * yp, x^(p^2), y^(p^2) = y * yp2, f^p
+    xp = R.pow(x, p)
+    yp = R.pow(f, (p - 1) // 2)
+    xp2 = R.pow(xp, p)
+    yp2 = mul(yp, R.pow(yp, p))
+    fp = mul(f, mul(yp, yp))
+
+    fs = _division_polys(R, x, f, l + 2, a, b)
+    (Xn, Xd), (Yn, Yd) = _multiple(R, fs, q, x, f)
+
+    # Is pi^2(P) = +-q*P on (part of) the l-torsion?
+    D = _poly_sub(mul(xp2, Xd), Xn, p)
+    if not R.is_zero(D):
+        g = _poly_gcd(R.reduce(D), h, p)
+        if len(g) > 1:
+            raise _Split(_poly_divmod(h, g, p)[0])
+
+        # generic case: L = pi^2(P) + q*P, then find j with j*pi(P) = L
+        Ln = mul(_poly_sub(mul(yp2, Yd), Yn, p), Xd)
+        Ld = mul(Yd, D)
+        Ld2 = mul(Ld, Ld)
+        XLn = _poly_sub(mul(mul(f, mul(Ln, Ln)), Xd), mul(_poly_add(mul(xp2, Xd), Xn, p), Ld2), p)
+        XLd = mul(Ld2, Xd)
+        YLn = _poly_sub(mul(Ln, _poly_sub(mul(xp2, XLd), XLn, p)), mul(mul(yp2, Ld), XLd), p)
+        YLd = mul(Ld, XLd)
+
+        gs = _division_polys(R, xp, fp, (l - 1) // 2 + 2, a, b)
+        for j in range(1, (l - 1) // 2 + 1):
+            (Xjn, Xjd), (Yjn, Yjd) = _multiple(R, gs, j, xp, fp)
+            if R.is_zero(_poly_sub(mul(XLn, Xjd), mul(Xjn, XLd), p)):
+                if R.is_zero(_poly_sub(mul(YLn, Yjd), mul(mul(yp, Yjn), YLd), p)):
+                    return j
+                return (-j) % l
+        raise RuntimeError("Schoof: no match for t mod %d" % l)
+
+    # pi^2 = -q on these points  ->  t = 0
+    if not R.is_zero(_poly_sub(mul(yp2, Yd), Yn, p)):
+        return 0
+
+    # pi^2 = q: t = 0 unless q is a square w^2 mod l, then pi = +-w and t = +-2w
+    w = next((w for w in range(1, l) if w * w % l == q), None)
+    if w is None:
+        return 0
+    (_, _), (Ywn, Ywd) = _multiple(R, fs, w, x, f)
+    if R.is_zero(_poly_sub(mul(yp, Ywd), Ywn, p)):
+        return 2 * w % l
+    return -2 * w % l
+
+
+def _trace_mod_l(p, a, b, l):
+    """t mod l for an odd prime l != p."""
+    # psi_l as a plain polynomial (no modulus yet), made monic
+    plain = _PolyMod(None, p)
+    psi = _division_polys(plain, [0, 1], [b % p, a % p, 0, 1], l, a % p, b % p)[l]
+    h = _poly_scale(psi, pow(psi[-1], -1, p), p)
+
+    while True:
+        try:
+            return _trace_mod_l_on(h, p, a % p, b % p, l)
+        except _Split as split:
+            h = _poly_scale(split.factor, pow(split.factor[-1], -1, p), p)
+
+
+def count_points_schoof(p, a, b, early_abort=None):
+    """
+    #E(F_p) with Schoof's algorithm (p > 3).
+    If early_abort is an int c, stop and return None as soon as some prime
+    l > c is found to divide the group order (used by the generator to skip
+    curves that cannot have cofactor <= c).
+    """
+    F = _PolyMod([b % p, a % p, 0, 1], p)
+
+    # t mod 2: t is even iff x^3 + ax + b has a root, i.e. there is 2-torsion
+    xp = F.pow([0, 1], p)
+    has_root = len(_poly_gcd(_poly_sub(xp, [0, 1], p), F.h, p)) > 1
+    residues = {2: 0 if has_root else 1}
+    if early_abort is not None and has_root and 2 > early_abort:
+        return None
+
+    M, l = 2, 2
+    while M <= 4 * isqrt(p) + 4:
+        l = _next_prime(l)
+        if l == p:
+            continue
+        t = _trace_mod_l(p, a, b, l)
+        if early_abort is not None and l > early_abort and (p + 1 - t) % l == 0:
+            return None
+        residues[l] = t
+        M *= l
+
+    # CRT, then take the representative with |t| <= M/2
+    t = 0
+    for l, r in residues.items():
+        Ml = M // l
+        t = (t + r * Ml * pow(Ml, -1, l)) % M
+    if t > M // 2:
+        t -= M
+    return p + 1 - t
+
+
+# ----------- Disk cache -----------
+def _load_cache(path):
+    try:
+        with open(path) as fh:
+            return json.load(fh)
+    except (OSError, ValueError):
+        return {"counts": {}, "curves": {}}
+
+
+def _save_cache(path, cache):
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    tmp = path + ".tmp"
+    with open(tmp, "w") as fh:
+        json.dump(cache, fh, indent=1)
+    os.replace(tmp, path)
+
+
+def count_points(p, a, b, cache_path=None, rng=random):
+    """#E(F_p), with BSGS below SCHOOF_MIN_BITS and Schoof above; cached on disk."""
+    path = cache_path or CACHE_PATH
+    cache = _load_cache(path)
+    key = f"{p}:{a % p}:{b % p}"
+    if key in cache["counts"]:
+        return cache["counts"][key]
+
+    if p.bit_length() < SCHOOF_MIN_BITS:
+        N = count_points_bsgs(p, a % p, b % p, rng)
+    else:
+        N = count_points_schoof(p, a % p, b % p)
+    cache["counts"][key] = N
+    _save_cache(path, cache)
+    return N
+
+
+# ----------- Curve generation -----------
+def _order_split(N, max_cofactor):
+    """(h, n) with N = h * n, n prime and h <= max_cofactor, or None."""
+    for h in range(1, max_cofactor + 1):
+        if N % h == 0 and is_probable_prime(N // h) and N // h > max_cofactor:
+            return h, N // h
+    return None
+
+
+def generate_curve_params(bits, max_cofactor=1, rng=random):
+    """
+    Search for a random curve over a `bits`-bit prime field with order
+    h * n, n prime, h <= max_cofactor. Returns a dict of p, a, b, Gx, Gy, n, h.
+    """
+    if bits < 4:
+        raise ValueError("bits must be at least 4")
+    while True:
+        p = random_prime(bits, rng)
+        a = rng.randrange(p)
+        b = rng.randrange(1, p)
+        if (4 * a ** 3 + 27 * b ** 2) % p == 0:
+            continue
+
+        if bits < SCHOOF_MIN_BITS:
+            N = count_points_bsgs(p, a, b, rng)
+        else:
+            N = count_points_schoof(p, a, b, early_abort=max_cofactor)
+            if N is None:
+                continue
+
+        split = _order_split(N, max_cofactor)
+        if split is None or N == p:  # anomalous curves are trivially weak
+            continue
+        h, n = split
+
+        curve = _ScratchCurve(p, a, b, 0, 0, n)
+        while True:
+            G = curve.scalar_mult(h, Point(*_random_point(p, a, b, rng), curve))
+            if G is not curve.O:
+                break
+        return dict(p=p, a=a, b=b, Gx=G.x, Gy=G.y, n=n, h=h)
+
+
+def generate_curve(bits, max_cofactor=1, cache=True, cache_path=None, rng=random):
+    """
+    EllipticCurve over a random `bits`-bit prime field with (near-)prime
+    order. With cache=True the first curve found for (bits, max_cofactor)
+    is stored on disk and returned again on later calls.
+    """
+    path = cache_path or CACHE_PATH
+    key = f"{bits}:{max_cofactor}"
+    params = None
+    if cache:
+        params = _load_cache(path)["curves"].get(key)
+    if params is None:
+        params = generate_curve_params(bits, max_cofactor, rng)
+        if cache:
+            stored = _load_cache(path)
+            stored["curves"][key] = params
+            _save_cache(path, stored)
+
+    params = dict(params)
+    params.pop("h", None)
+    return EllipticCurve(**params)
+
+
+if __name__ == "__main__":
+    import sys
+
+    for arg in sys.argv[1:] or ["32"]:
+        c = generate_curve(int(arg))
+        print(f"{arg}-bit: p={c.p} a={c.a} b={c.b} G=({c.G.x}, {c.G.y}) n={c.n}")
@@ -0,0 +1,103 @@
+# ecc/curves.py
+"""
+Named-curve registry.
+
+get(name) returns one shared, validated EllipticCurve per name, so every
+module that asks for the same curve also shares its lazily built
+precomputation (fixed-base tables, GLV constants, ...).
+
+    from ecc import curves
+    curve = curves.get("secp256k1")
+
+The toy curves are small enough to brute-force and are meant for the
+attack demos only:
+- toy23:   y^2 = x^3 + x + 1 over F_23, subgroup of order 7 (cofactor 4)
+- toy257:  y^2 = x^3 + x + 1 over F_257, subgroup of order 83 (cofactor 3)
+- toy9739: y^2 = x^3 + 497x + 1771 over F_9739, prime order 9719.
+  (The textbook curve with b = 1768 has composite order 9735 = 3*5*11*59,
+  which breaks the modular inversions ECDSA needs.)
+"""
+
+import threading
+
+from .curve import EllipticCurve
+
+_PARAMS = {
+    "secp256k1": dict(
+        p=0xFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFEFFFFFC2F,
+        a=0,
+        b=7,
+        Gx=0x79BE667EF9DCBBAC55A06295CE870B07029BFCDB2DCE28D959F2815B16F81798,
+        Gy=0x483ADA7726A3C4655DA4FBFC0E1108A8FD17B448A68554199C47D08FFB10D4B8,
+        n=0xFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFEBAAEDCE6AF48A03BBFD25E8CD0364141,
+    ),
+    "P-256": dict(
+        p=0xFFFFFFFF00000001000000000000000000000000FFFFFFFFFFFFFFFFFFFFFFFF,
+        a=-3,
+        b=0x5AC635D8AA3A93E7B3EBBD55769886BC651D06B0CC53B0F63BCE3C3E27D2604B,
+        Gx=0x6B17D1F2E12C4247F8BCE6E563A440F277037D812DEB33A0F4A13945D898C296,
+        Gy=0x4FE342E2FE1A7F9B8EE7EB4A7C0F9E162BCE33576B315ECECBB6406837BF51F5,
+        n=0xFFFFFFFF00000000FFFFFFFFFFFFFFFFBCE6FAADA7179E84F3B9CAC2FC632551,
+    ),
+    "toy23": dict(p=23, a=1, b=1, Gx=17, Gy=3, n=7),
+    "toy257": dict(p=257, a=1, b=1, Gx=72, Gy=97, n=83),
+    "toy9739": dict(p=9739, a=497, b=1771, Gx=1806, Gy=2485, n=9719),
+}
+
+_ALIASES = {
+    "secp256r1": "P-256",
+    "prime256v1": "P-256",
+    "p256": "P-256",
+}
+
+_curves = {}
+_lock = threading.Lock()
+
+
+def validate(curve):
+    """
+    Check that the curve is non-singular, G lies on it and n*G is infinity.
+    Raises ValueError otherwise.
+    """
+    p, a, b = curve.p, curve.a, curve.b
+    if (4 * a ** 3 + 27 * b ** 2) % p == 0:
+        raise ValueError("Singular curve: 4a^3 + 27b^2 = 0 (mod p)")
+
+    x, y = curve.G.x, curve.G.y
+    if (y * y - (x ** 3 + a * x + b)) % p != 0:
+        raise ValueError("Generator G is not on the curve")
+
+    if curve.scalar_mult(curve.n, curve.G) is not curve.O:
+        raise ValueError("n * G is not the point at infinity; wrong order n")
+
+
+def names():
+    """Names of all registered curves."""
+    return sorted(_PARAMS)
+
+
+def register(name, p, a, b, Gx, Gy, n):
+    """Add a curve to the registry (validated on first get)."""
+    with _lock:
+        if name in _PARAMS or name in _ALIASES:
+            raise ValueError(f"Curve {name!r} is already registered")
+        _PARAMS[name] = dict(p=p, a=a, b=b, Gx=Gx, Gy=Gy, n=n)
+
+
+def get(name):
+    """Return the shared EllipticCurve registered under `name`."""
+    name = _ALIASES.get(name, name)
+    curve = _curves.get(name)
+    if curve is not None:
+        return curve
+
+    with _lock:
+        curve = _curves.get(name)
+        if curve is None:
+            if name not in _PARAMS:
+                raise KeyError(f"Unknown curve {name!r}; known curves: {', '.join(names())}")
+            curve = EllipticCurve(**_PARAMS[name])
+            curve.name = name
+            validate(curve)
+            _curves[name] = curve
+    return curve
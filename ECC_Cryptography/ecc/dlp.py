@@ -0,0 +1,249 @@
+# ecc/dlp.py
+"""
+Elliptic-curve discrete logarithm solvers.
+
+- brute_force_dlog: walk P, 2P, 3P, ... (fine for a few thousand points)
+- pollard_rho: parallel Pollard rho with r-adding walks and distinguished
+  points (van Oorschot-Wiener), for curves of roughly 30-60 bits
+
+    from ecc import curvegen, dlp
+    curve = curvegen.generate_curve(40)
+    Q = 123456789 * curve.G
+    k = dlp.pollard_rho(curve, Q, progress=lambda steps, dps: print(steps, dps))
+
+Every walk point is kept as X = c*P + d*Q. Each worker process advances a
+batch of walks in affine coordinates, sharing one field inversion per step
+across the batch (Montgomery's trick), and hands back every point whose x
+has its low dp_bits bits clear. The parent keeps those distinguished points
+in one collision table; two walks that ever meet reach the same
+distinguished point, and c1 + d1*k = c2 + d2*k then gives k.
+"""
+
+import math
+import multiprocessing
+import os
+import queue
+import random
+
+from .curve import EllipticCurve, Point
+from .utils import batch_inverse
+
+NUM_STEPS = 32          # r in the r-adding walk; a power of two
+WALKS_PER_WORKER = 64   # walks advanced together, sharing one inversion per step
+BRUTE_FORCE_LIMIT = 1 << 12
+
+# per-process cache of (EllipticCurve, Q) rebuilt from plain parameters
+_worker_cache = {}
+
+
+def brute_force_dlog(curve, Q, P=None, n=None):
+    """Smallest k >= 0 with k*P == Q by trying every multiple, or None."""
+    P = curve.G if P is None else P
+    n = curve.n if n is None else n
+    if P is curve.G and curve.p < curve.small_table_limit:
+        return curve.discrete_log(Q)
+    R = curve.O
+    for k in range(n):
+        if R == Q:
+            return k
+        R = R + P
+    return None
+
+
+def _dp_bits(n, total_walks):
+    """
+    Distinguished-point density. After two walks collide it takes about
+    2^dp_bits more steps to notice, and every walk keeps stepping meanwhile,
+    so keep total_walks * 2^dp_bits well below the expected sqrt(pi*n/2) steps.
+    """
+    expected = math.sqrt(math.pi * n / 2)
+    return max(0, int(math.log2(max(1.0, expected / (16 * total_walks)))))
+
+
+def _worker_curve(params):
+    cached = _worker_cache.get(params)
+    if cached is None:
+        p, a, b, n, Px, Py, Qx, Qy = params
+        curve = EllipticCurve(p, a, b, Px, Py, n)
+        cached = (curve, Point(Qx, Qy, curve))
+        _worker_cache.clear()
+        _worker_cache[params] = cached
+    return cached
+
+
+def _start(curve, Q, rng):
+    """A fresh random walk point (x, y, c, d) with (x, y) = c*P + d*Q."""
+    n = curve.n
+    while True:
+        c, d = rng.randrange(n), rng.randrange(1, n)
+        X = curve.multi_scalar_mult([(c, curve.G), (d, Q)])
+        if X is not curve.O:
+            return [X.x, X.y, c, d, 0]
+
+
+def _walk_round(task):
+    """
+    Advance every walk in `task` by `iterations` steps. Returns the updated
+    walks and the distinguished points (x, y, c, d) met on the way.
+    """
+    params, steps, walks, iterations, dp_bits, seed = task
+    curve, Q = _worker_curve(params)
+    rng = random.Random(seed)
+    p, n = curve.p, curve.n
+    sx, sy, sc, sd = steps
+    r_mask = len(sx) - 1
+    dp_mask = (1 << dp_bits) - 1
+    max_len = 20 << dp_bits  # a walk this long is probably stuck in a cycle
+
+    walks = [w if w is not None else _start(curve, Q, rng) for w in walks]
+    xs = [w[0] for w in walks]
+    ys = [w[1] for w in walks]
+    cs = [w[2] for w in walks]
+    ds = [w[3] for w in walks]
+    lens = [w[4] for w in walks]
+    found = []
+
+    for _ in range(iterations):
+        js = [(x >> dp_bits) & r_mask for x in xs]
+        dens = [sx[j] - x for j, x in zip(js, xs)]
+        if 0 in dens:
+            # X = +-M_j: the chord formula breaks down, restart those walks
+            for i, den in enumerate(dens):
+                if den == 0:
+                    xs[i], ys[i], cs[i], ds[i], lens[i] = _start(curve, Q, rng)
+                    dens[i] = sx[js[i]] - xs[i]
+        invs = batch_inverse(dens, p)
+
+        for i, j in enumerate(js):
+            x, y = xs[i], ys[i]
+            lam = (sy[j] - y) * invs[i] % p
+            x3 = (lam * lam - x - sx[j]) % p
+            y3 = (lam * (x - x3) - y) % p
+            c = (cs[i] + sc[j]) % n
+            d = (ds[i] + sd[j]) % n
+            if x3 & dp_mask == 0:
+                found.append((x3, y3, c, d))
+                xs[i], ys[i], cs[i], ds[i], lens[i] = _start(curve, Q, rng)
+            elif lens[i] > max_len:
+                xs[i], ys[i], cs[i], ds[i], lens[i] = _start(curve, Q, rng)
+            else:
+                xs[i], ys[i], cs[i], ds[i] = x3, y3, c, d
+                lens[i] += 1
+
+    walks = [list(w) for w in zip(xs, ys, cs, ds, lens)]
+    return walks, found, iterations * len(walks)
+
+
+def _collide(table, point, n):
+    """
+    Insert a distinguished point; return k if it completes a collision.
+    table maps x -> (y, c, d).
+    """
+    x, y, c, d = point
+    other = table.get(x)
+    if other is None:
+        table[x] = (y, c, d)
+        return None
+    y2, c2, d2 = other
+    if y2 == y:
+        # c + d*k = c2 + d2*k
+        num, den = c2 - c, d - d2
+    else:
+        # c + d*k = -(c2 + d2*k)
+        num, den = -(c + c2), d + d2
+    if den % n == 0:
+        return None
+    try:
+        return num * pow(den, -1, n) % n
+    except ValueError:  # n not prime
+        return None
+
+
+def pollard_rho(curve, Q, P=None, n=None, workers=None, dp_bits=None,
+                progress=None, max_steps=None, seed=None):
+    """
+    Find k with k*P == Q (P defaults to curve.G, n to curve.n; n must be the
+    prime order of P).
+
+    workers:   processes in the multiprocessing pool (default os.cpu_count());
+               workers=1 runs in this process.
+    dp_bits:   a point is distinguished when the low dp_bits bits of x are 0;
+               chosen from n and the number of walks by default.
+    progress:  called as progress(steps, distinguished_points) after every round.
+    max_steps: give up and return None after about this many steps.
+    """
+    P = curve.G if P is None else P
+    n = curve.n if n is None else n
+    if P is curve.O:
+        raise ValueError("P must not be the point at infinity")
+    if Q is curve.O:
+        return 0
+    if n < BRUTE_FORCE_LIMIT:
+        return brute_force_dlog(curve, Q, P, n)
+
+    workers = workers or os.cpu_count() or 1
+    total_walks = workers * WALKS_PER_WORKER
+    if dp_bits is None:
+        dp_bits = _dp_bits(n, total_walks)
+    expected = math.sqrt(math.pi * n / 2)
+    iterations = max(16, min(4096, int(expected) // total_walks))
+
+    rng = random.Random(seed)
+    params = (curve.p, curve.a, curve.b, n, P.x, P.y, Q.x, Q.y)
+    walk_curve, walk_Q = _worker_curve(params)
+
+    # step table M_j = c_j*P + d_j*Q
+    sx, sy, sc, sd = [], [], [], []
+    while len(sx) < NUM_STEPS:
+        c, d = rng.randrange(n), rng.randrange(n)
+        M = walk_curve.multi_scalar_mult([(c, walk_curve.G), (d, walk_Q)])
+        if M is not walk_curve.O:
+            sx.append(M.x)
+            sy.append(M.y)
+            sc.append(c)
+            sd.append(d)
+    steps = (sx, sy, sc, sd)
+
+    def task(walks):
+        return (params, steps, walks, iterations, dp_bits, rng.getrandbits(64))
+
+    table = {}
+    total = 0
+
+    def consume(result):
+        nonlocal total
+        walks, found, done = result
+        total += done
+        for point in found:
+            k = _collide(table, point, n)
+            if k is not None and curve.scalar_mult(k, P) == Q:
+                return walks, k
+        if progress is not None:
+            progress(total, len(table))
+        return walks, None
+
+    if workers == 1:
+        walks = [None] * WALKS_PER_WORKER
+        while max_steps is None or total < max_steps:
+            walks, k = consume(_walk_round(task(walks)))
+            if k is not None:
+                return k
+        return None
+
+    results = queue.Queue()
+    with multiprocessing.Pool(workers) as pool:
+        def submit(walks):
+            pool.apply_async(_walk_round, (task(walks),),
+                             callback=results.put, error_callback=results.put)
+
+        for _ in range(workers):
+            submit([None] * WALKS_PER_WORKER)
+        while max_steps is None or total < max_steps:
+            result = results.get()
+            if isinstance(result, BaseException):
+                raise result
+            walks, k = consume(result)
+            if k is not None:
+                return k
+            submit(walks)
+    return None
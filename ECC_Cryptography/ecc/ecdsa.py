@@ -1,7 +1,181 @@
 # ecc/ecdsa.py
-import hashlib
-from random import randint
-from typing import Tuple, Optional
+import secrets
+import threading
+from collections import OrderedDict
+from typing import List, Tuple, Optional
+
+from .curve import Point
+from .presign import PresignaturePool
+from .rfc6979 import RFC6979
+from .utils import batch_inverse, sha256_bytes, sha256_file, sha256_stream
+
+
+class Signature(tuple):
+    """
+    ECDSA signature: unpacks, indexes and compares like the plain (r, s)
+    tuple, and also carries the recovery id of the nonce point R:
+    recid = (R.y & 1) | 2 * (R.x // n), or None if unknown.
+    """
+
+    def __new__(cls, r: int, s: int, recid: Optional[int] = None):
+        sig = super().__new__(cls, (r, s))
+        sig.recid = recid
+        return sig
+
+    @property
+    def r(self) -> int:
+        return self[0]
+
+    @property
+    def s(self) -> int:
+        return self[1]
+
+    def __reduce__(self):
+        return (Signature, (self[0], self[1], self.recid))
+
+    def __repr__(self):
+        return f"Signature(r={self[0]}, s={self[1]}, recid={self.recid})"
+
+
+def _sign_with_k(curve, d: int, z: int, k: int) -> Optional[Signature]:
+    """(r, s) for hash z under key d with nonce k, or None if r or s is 0."""
+    n = curve.n
+    P = curve.scalar_mult(k, curve.G)
+    if P is curve.O:
+        return None
+    r = P.x % n
+    if r == 0:
+        return None
+    s = pow(k, -1, n) * (z + r * d) % n
+    if s == 0:
+        return None
+    recid = (P.y & 1) | (P.x // n) << 1
+    return Signature(r, s, recid)
+
+
+class SigningContext:
+    """
+    State for signing many messages under one private key with RFC 6979
+    deterministic nonces: the key's octets and pre-keyed HMAC state (see
+    rfc6979.RFC6979) and the curve's fixed-base table for G, built up front
+    so no signature pays for it.
+    """
+
+    def __init__(self, private_key: int, curve):
+        if not 1 <= private_key < curve.n:
+            raise ValueError("Private key must be in [1, n-1]")
+        self.curve = curve
+        self.private_key = private_key
+        self.nonces = RFC6979(private_key, curve.n)
+
+        self.g_table = curve.fixed_base_table()
+
+    def sign(self, msg) -> Signature:
+        """Deterministic ECDSA signature of `msg` (str or bytes; SHA-256, RFC 6979 nonce)."""
+        return self.sign_digest(sha256_bytes(msg))
+
+    def sign_digest(self, digest: bytes) -> Signature:
+        """Deterministic ECDSA signature of a precomputed SHA-256 digest."""
+        z = int.from_bytes(digest, 'big') % self.curve.n
+        for k in self.nonces.nonces(digest):
+            sig = _sign_with_k(self.curve, self.private_key, z, k)
+            if sig is not None:
+                return sig
+
+
+class VerificationCache:
+    """
+    LRU cache of per-public-key wNAF tables for verify(): a key's table is
+    built on first sight and reused for u2*Q on every later verification.
+    By default every ECDSA object on a curve shares that curve's cache (see
+    for_curve), so short-lived verifiers still benefit.
+
+    capacity can be changed at any time (shrinking evicts the least recently
+    used keys); hits, misses and stats() report how well it works.
+    """
+
+    # default window for cached tables: wider than the per-call window since
+    # the precomputation is paid once per key
+    window_width = 7
+
+    _shared_lock = threading.Lock()
+
+    def __init__(self, curve, capacity: int = 4096, window_width: Optional[int] = None):
+        self.curve = curve
+        self.window_width = window_width or self.window_width
+        self.hits = 0
+        self.misses = 0
+        self._capacity = capacity
+        self._tables = OrderedDict()
+        self._lock = threading.Lock()
+
+    @classmethod
+    def for_curve(cls, curve) -> "VerificationCache":
+        """
+        The cache shared by every ECDSA object on `curve`. It is stored on
+        the curve itself, so it lives exactly as long as the curve does.
+        """
+        cache = curve._verify_cache
+        if cache is None:
+            with cls._shared_lock:
+                cache = curve._verify_cache
+                if cache is None:
+                    cache = curve._verify_cache = cls(curve)
+        return cache
+
+    @property
+    def capacity(self) -> int:
+        return self._capacity
+
+    @capacity.setter
+    def capacity(self, value: int):
+        with self._lock:
+            self._capacity = value
+            while len(self._tables) > max(value, 0):
+                self._tables.popitem(last=False)
+
+    def __len__(self):
+        return len(self._tables)
+
+    def table(self, Q):
+        """
+        Q's cached WnafTable, building (and possibly evicting) on a miss.
+        With capacity 0 caching is off and Q itself is returned.
+        """
+        if self._capacity <= 0:
+            return Q
+        key = (Q.x, Q.y)
+        with self._lock:
+            table = self._tables.get(key)
+            if table is not None:
+                self._tables.move_to_end(key)
+                self.hits += 1
+                return table
+            self.misses += 1
+
+        table = self.curve.wnaf_table(Q, self.window_width)
+        with self._lock:
+            self._tables[key] = table
+            while len(self._tables) > self._capacity:
+                self._tables.popitem(last=False)
+        return table
+
+    def stats(self) -> dict:
+        with self._lock:
+            total = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": self.hits / total if total else 0.0,
+                "size": len(self._tables),
+                "capacity": self._capacity,
+            }
+
+    def clear(self):
+        with self._lock:
+            self._tables.clear()
+            self.hits = self.misses = 0
+
 
 class ECDSA:
     """
@@ -9,65 +183,110 @@ class ECDSA:
     Works for both small toy curves and large curves like secp256k1.
     """
 
-    def __init__(self, curve, private_key: Optional[int] = None, public_key=None):
+    # verify_batch only uses the random-weight check when n has at least
+    # this many bits; on smaller groups a bad batch could pass by chance
+    batch_min_order_bits = 128
+
+    def __init__(self, curve, private_key: Optional[int] = None, public_key=None,
+                 verify_cache: Optional[VerificationCache] = None):
         self.curve = curve
         self.private_key = private_key
         self.public_key = public_key
+        self._context = None  # SigningContext for private_key, made on first sign
+        self.presignatures = None  # optional PresignaturePool, see use_presignatures
+        self._owns_presignatures = False  # True if use_presignatures created it
+        # per-public-key tables for verify, shared per curve unless given
+        self.verify_cache = verify_cache if verify_cache is not None else VerificationCache.for_curve(curve)
 
-    def _hash_msg(self, msg: str) -> int:
-        """Return SHA-256(msg) reduced modulo curve.n."""
-        z = int.from_bytes(hashlib.sha256(msg.encode()).digest(), 'big')
-        return z % self.curve.n
+    def _hash_msg(self, msg) -> int:
+        """Return SHA-256(msg) reduced modulo curve.n (msg is str or bytes)."""
+        return int.from_bytes(sha256_bytes(msg), 'big') % self.curve.n
 
-    def sign(self, msg: str, k: Optional[int] = None) -> Tuple[int, int]:
+    def sign(self, msg, k: Optional[int] = None) -> Signature:
         """
-        Produce an ECDSA signature (r, s) for the message `msg`.
-        Optional deterministic k can be supplied for testing.
+        Produce an ECDSA signature (r, s) for the message `msg` (str or
+        bytes), as a Signature that also carries the recovery id.
+        The nonce comes from the presignature pool if one is attached,
+        otherwise from RFC 6979 (see SigningContext), unless a fixed k is
+        supplied for testing.
         """
+        return self.sign_digest(sha256_bytes(msg), k)
+
+    def sign_stream(self, fileobj) -> Signature:
+        """Sign the rest of a binary file object, hashed in chunks."""
+        return self.sign_digest(sha256_stream(fileobj))
+
+    def sign_file(self, path) -> Signature:
+        """Sign a file's contents, hashed from an mmap of the file."""
+        return self.sign_digest(sha256_file(path))
+
+    def sign_digest(self, digest: bytes, k: Optional[int] = None) -> Signature:
+        """Sign a precomputed SHA-256 digest; see sign() for the nonce."""
         if self.private_key is None:
             raise ValueError("Private key not set for signing")
 
         n = self.curve.n
-        G = self.curve.G
-        d = self.private_key
-        z = self._hash_msg(msg)
+        z = int.from_bytes(digest, 'big') % n
+        if k is None and self.presignatures is not None:
+            while True:
+                _, r, k_inv, recid = self.presignatures.take()
+                s = k_inv * (z + r * self.private_key) % n
+                if s:
+                    return Signature(r, s, recid)
+
+        if k is None:
+            context = self._context
+            if context is None or context.private_key != self.private_key:
+                context = self._context = SigningContext(self.private_key, self.curve)
+            return context.sign_digest(digest)
 
-        while True:
-            # Random or deterministic k
-            if k is None:
-                k = randint(1, n - 1)
-
-            # Point multiplication mod p
-            P = k * G
-            if P is None or getattr(P, "x", None) is None:
-                if k is not None:
-                    raise ValueError(f"Invalid deterministic k={k}")
-                continue
-
-            r = P.x % n
-            if r == 0:
-                if k is not None:
-                    raise ValueError(f"r=0 for deterministic k={k}")
-                k = None
-                continue
-
-            k_inv = pow(k, -1, n)
-            s = (k_inv * (z + r * d) % n) % n
-            if s == 0:
-                if k is not None:
-                    raise ValueError(f"s=0 for deterministic k={k}")
-                k = None
-                continue
-
-            return (r, s)
-
-    def verify(self, msg: str, sig: Tuple[int, int], Q) -> bool:
+        sig = _sign_with_k(self.curve, self.private_key, z, k)
+        if sig is None:
+            raise ValueError(f"r=0 or s=0 for deterministic k={k}")
+        return sig
+
+    def use_presignatures(self, pool: Optional[PresignaturePool] = None, **options) -> PresignaturePool:
+        """
+        Sign from a pool of presignatures from now on, so sign() does no
+        scalar multiplication. Presignatures do not depend on the key, so
+        one pool may serve several ECDSA objects on the same curve. Without
+        a pool, one is created with **options (size, low_water, batch, process).
+
+        A pool passed in stays owned by the caller, who closes it. A pool
+        created here is closed when a later call replaces it.
+        """
+        owned = pool is None
+        if owned:
+            pool = PresignaturePool(self.curve, **options)
+        elif pool.curve is not self.curve:
+            raise ValueError("Presignature pool belongs to a different curve")
+        previous = self.presignatures
+        if previous is not None and previous is not pool and self._owns_presignatures:
+            previous.close()
+        self.presignatures = pool
+        self._owns_presignatures = owned
+        return pool
+
+    def verify(self, msg, sig: Tuple[int, int], Q) -> bool:
         """
         Verify ECDSA signature.
+        - msg: str or bytes
         - sig: (r, s)
         - Q: public key point
         Returns True if valid, False otherwise.
         """
+        return self.verify_digest(sha256_bytes(msg), sig, Q)
+
+    def verify_stream(self, fileobj, sig: Tuple[int, int], Q) -> bool:
+        """verify() for the rest of a binary file object, hashed in chunks."""
+        return self.verify_digest(sha256_stream(fileobj), sig, Q)
+
+    def verify_file(self, path, sig: Tuple[int, int], Q) -> bool:
+        """verify() for a file's contents, hashed from an mmap of the file."""
+        return self.verify_digest(sha256_file(path), sig, Q)
+
+    def verify_digest(self, digest: bytes, sig: Tuple[int, int], Q) -> bool:
+        """verify() for a precomputed SHA-256 digest."""
         r, s = sig
         n = self.curve.n
 
@@ -75,7 +294,7 @@ class ECDSA:
         if not (1 <= r < n and 1 <= s < n):
             return False
 
-        z = self._hash_msg(msg)
+        z = int.from_bytes(digest, 'big') % n
 
         try:
             s_inv = pow(s, -1, n)
@@ -85,9 +304,134 @@ class ECDSA:
         u1 = (z * s_inv) % n
         u2 = (r * s_inv) % n
 
-        X = u1 * self.curve.G + u2 * Q
+        # u1*G + u2*Q with one shared doubling chain, using Q's cached table
+        if Q._Z != 0:
+            Q = self.verify_cache.table(Q)
+        X = self.curve.multi_scalar_mult([(u1, self.curve.G), (u2, Q)])
 
         if X is None or getattr(X, "x", None) is None:
             return False
 
         return (X.x % n) == r
+
+    def recover_public_key(self, msg, sig: Tuple[int, int], recid: Optional[int] = None):
+        """
+        Recover the public key Q that produced `sig` on `msg`:
+        Q = r^-1 * (s*R - z*G), computed with one Shamir double-scalar
+        multiplication. recid defaults to sig.recid.
+        Raises ValueError if no public key fits.
+        """
+        r, s = sig
+        if recid is None:
+            recid = getattr(sig, "recid", None)
+        if recid is None:
+            raise ValueError("Recovery id needed to recover the public key")
+        n = self.curve.n
+        if not (1 <= r < n and 1 <= s < n):
+            raise ValueError("Signature out of range")
+
+        R = self._lift_x(r, recid)
+        if R is None:
+            raise ValueError(f"No point R for r={r} and recid={recid}")
+        z = self._hash_msg(msg)
+        r_inv = pow(r, -1, n)
+        Q = self.curve.multi_scalar_mult([(s * r_inv % n, R), (-z * r_inv % n, self.curve.G)])
+        if Q is self.curve.O:
+            raise ValueError("Recovered public key is the point at infinity")
+        return Q
+
+    def _lift_x(self, r: int, recid: int):
+        """
+        The nonce point R of a signature: R.x = r + (recid >> 1) * n and the
+        parity of R.y is recid & 1. None if there is no such point.
+        """
+        curve = self.curve
+        x = r + (recid >> 1) * curve.n
+        if x >= curve.p:
+            return None
+        y = curve.field.sqrt((x * x * x + curve.a * x + curve.b) % curve.p)
+        if y is None:
+            return None
+        y = int(y)
+        if y & 1 != recid & 1:
+            if y == 0:
+                return None
+            y = curve.p - y
+        return Point(x, y, curve)
+
+    def _batch_holds(self, group) -> bool:
+        """
+        Check sum(w_i * (u1_i*G + u2_i*Q_i - R_i)) == O for random 128-bit
+        weights w_i, with one multi-scalar multiplication. Terms for the same
+        public key are merged.
+        """
+        n = self.curve.n
+        g = 0
+        by_key = {}
+        scalars, points = [], []
+        for _, u1, u2, Q, R in group:
+            w = secrets.randbits(128) or 1
+            g += w * u1
+            by_key[Q] = by_key.get(Q, 0) + w * u2
+            scalars.append(-w % n)
+            points.append(R)
+        for Q, k in by_key.items():
+            scalars.append(k % n)
+            points.append(Q)
+        scalars.append(g % n)
+        points.append(self.curve.G)
+        return self.curve.msm(scalars, points) is self.curve.O
+
+    def verify_batch(self, items) -> List[bool]:
+        """
+        Verify many signatures at once; returns one bool per item, the same
+        as verify() would give.
+        - items: (msg, sig, Q) or (msg, sig, Q, recid) tuples; without an
+          explicit recid, sig.recid is used when sig is a Signature
+        Items with a recid are checked together with one msm (see
+        _batch_holds); if the batch fails it is bisected to find the bad
+        signatures. Items without a recid, and every item on curves with
+        n below 2^batch_min_order_bits, are verified one by one.
+        """
+        items = [tuple(item) for item in items]
+        results = [False] * len(items)
+        n = self.curve.n
+        batched = n.bit_length() >= self.batch_min_order_bits
+
+        pending = []
+        for i, item in enumerate(items):
+            msg, sig, Q = item[:3]
+            r, s = sig
+            recid = item[3] if len(item) > 3 else getattr(sig, "recid", None)
+            if not batched or recid is None:
+                results[i] = self.verify(msg, (r, s), Q)
+            elif 1 <= r < n and 1 <= s < n:
+                R = self._lift_x(r, recid)
+                if R is None:
+                    results[i] = self.verify(msg, (r, s), Q)
+                else:
+                    pending.append((i, self._hash_msg(msg), r, s, Q, R))
+
+        # u1 = z/s, u2 = r/s with one shared inversion of all the s values
+        s_invs = batch_inverse([s for _, _, _, s, _, _ in pending], n)
+        group = [
+            (i, z * s_inv % n, r * s_inv % n, Q, R)
+            for (i, z, r, _, Q, R), s_inv in zip(pending, s_invs)
+        ]
+
+        def check(group):
+            if len(group) == 1:
+                i = group[0][0]
+                msg, sig, Q = items[i][:3]
+                results[i] = self.verify(msg, sig, Q)
+            elif self._batch_holds(group):
+                for i, *_ in group:
+                    results[i] = True
+            else:
+                half = len(group) // 2
+                check(group[:half])
+                check(group[half:])
+
+        if group:
+            check(group)
+        return results
@@ -1,4 +1,9 @@
 # ecc/encoder.py
+from functools import lru_cache
+
+from .curve import Point
+from .ecdsa import Signature
+
 
 def encode_point(point):
     """
@@ -35,3 +40,207 @@ def decode_point(encoded: bytes):
     x = int.from_bytes(xb, "big")
     y = int.from_bytes(yb, "big")
     return (x, y)
+
+
+# ----------- SEC1 compressed points -----------
+# number of decompressed points kept (repeat senders skip the square root)
+DECOMPRESS_CACHE_SIZE = 4096
+
+
+def _field_len(curve):
+    return (curve.p.bit_length() + 7) // 8
+
+
+def encode_point_compressed(point, curve=None):
+    """
+    Encode a point in SEC1 compressed form: 0x02 / 0x03 (parity of y)
+    followed by x as a fixed-length big-endian field element.
+    The point at infinity is the single byte 0x00.
+    `curve` is only needed when point is an (x, y) tuple.
+    """
+    if isinstance(point, tuple):
+        x, y = point
+    else:
+        curve = point.curve
+        if point.x is None:
+            return b"\x00"
+        x, y = point.x, point.y
+
+    prefix = b"\x03" if y & 1 else b"\x02"
+    return prefix + x.to_bytes(_field_len(curve), 'big')
+
+
+@lru_cache(maxsize=DECOMPRESS_CACHE_SIZE)
+def _decompress(curve, data):
+    if data == b"\x00":
+        return curve.O
+    if len(data) != 1 + _field_len(curve) or data[0] not in (2, 3):
+        raise ValueError("Not a SEC1 compressed point")
+
+    p = curve.p
+    x = int.from_bytes(data[1:], 'big')
+    if x >= p:
+        raise ValueError("x coordinate out of range")
+
+    # y^2 = x^3 + ax + b; field.sqrt uses the p = 3 (mod 4) shortcut
+    # (e.g. secp256k1) and Tonelli-Shanks otherwise
+    y = curve.field.sqrt((x * x * x + curve.a * x + curve.b) % p)
+    if y is None:
+        raise ValueError("Point is not on the curve")
+    y = int(y)
+    if y & 1 != data[0] & 1:
+        if y == 0:
+            raise ValueError("No point with odd y for this x (y = 0)")
+        y = p - y
+    return Point(x, y, curve)
+
+
+def decode_point_compressed(data, curve):
+    """
+    Decode a SEC1 compressed point (see encode_point_compressed) into a
+    Point on `curve`. Results are kept in an LRU cache.
+    """
+    return _decompress(curve, bytes(data))
+
+
+def decompress_cache_info():
+    """Hit/miss statistics of the decompression cache."""
+    return _decompress.cache_info()
+
+
+def decompress_cache_clear():
+    _decompress.cache_clear()
+
+
+# ----------- Signatures: compact and DER -----------
+def _scalar_len(curve):
+    """Bytes per scalar: 32 (64-byte compact signatures) unless a curve says otherwise."""
+    return 32 if curve is None else (curve.n.bit_length() + 7) // 8
+
+
+def _der_int(v):
+    b = v.to_bytes(v.bit_length() // 8 + 1, 'big')  # leading 0x00 keeps it positive
+    return b"\x02" + _der_len(len(b)) + b
+
+
+def _der_len(n):
+    if n < 0x80:
+        return bytes([n])
+    b = n.to_bytes((n.bit_length() + 7) // 8, 'big')
+    return bytes([0x80 | len(b)]) + b
+
+
+def _der_read_len(view, i):
+    """(length, next offset) of the DER length field at view[i]."""
+    first = view[i]
+    if first < 0x80:
+        return first, i + 1
+    count = first & 0x7F
+    if count == 0 or count > 4 or view[i + 1] == 0:
+        raise ValueError("Bad DER length")
+    n = int.from_bytes(view[i + 1:i + 1 + count], 'big')
+    if n < 0x80:
+        raise ValueError("Non-minimal DER length")
+    return n, i + 1 + count
+
+
+def _der_read_int(view, i):
+    if view[i] != 0x02:
+        raise ValueError("Expected DER INTEGER")
+    n, i = _der_read_len(view, i + 1)
+    if n == 0 or i + n > len(view):
+        raise ValueError("Bad DER INTEGER length")
+    if view[i] & 0x80:
+        raise ValueError("Negative DER INTEGER")
+    if n > 1 and view[i] == 0 and not view[i + 1] & 0x80:
+        raise ValueError("Non-minimal DER INTEGER")
+    return int.from_bytes(view[i:i + n], 'big'), i + n
+
+
+def _der_read_sig(view, i):
+    """Parse one DER signature starting at view[i]; returns (Signature, next offset)."""
+    try:
+        return _der_parse_sig(view, i)
+    except IndexError:
+        raise ValueError("Truncated DER signature") from None
+
+
+def _der_parse_sig(view, i):
+    if view[i] != 0x30:
+        raise ValueError("Expected DER SEQUENCE")
+    n, body = _der_read_len(view, i + 1)
+    end = body + n
+    if end > len(view):
+        raise ValueError("Truncated DER signature")
+    r, j = _der_read_int(view, body)
+    s, j = _der_read_int(view, j)
+    if j != end:
+        raise ValueError("Trailing bytes in DER signature")
+    return Signature(r, s), end
+
+
+def encode_sig(sig, fmt="compact", curve=None):
+    """
+    Encode an (r, s) signature.
+    - "compact": r || s as fixed-length big-endian scalars (64 bytes for
+      256-bit curves; the scalar length follows curve.n when a curve is given)
+    - "der": ASN.1 DER SEQUENCE { INTEGER r, INTEGER s }
+    """
+    r, s = sig
+    if fmt == "compact":
+        size = _scalar_len(curve)
+        return r.to_bytes(size, 'big') + s.to_bytes(size, 'big')
+    if fmt == "der":
+        body = _der_int(r) + _der_int(s)
+        return b"\x30" + _der_len(len(body)) + body
+    raise ValueError(f"Unknown signature format {fmt!r} (expected 'compact' or 'der')")
+
+
+def decode_sig(data, fmt="compact", curve=None):
+    """Decode one signature written by encode_sig into a Signature (r, s)."""
+    view = memoryview(data).cast('B')
+    if fmt == "compact":
+        size = _scalar_len(curve)
+        if len(view) != 2 * size:
+            raise ValueError(f"Compact signature must be {2 * size} bytes")
+        return Signature(int.from_bytes(view[:size], 'big'), int.from_bytes(view[size:], 'big'))
+    if fmt == "der":
+        sig, end = _der_read_sig(view, 0)
+        if end != len(view):
+            raise ValueError("Trailing bytes after DER signature")
+        return sig
+    raise ValueError(f"Unknown signature format {fmt!r} (expected 'compact' or 'der')")
+
+
+def encode_sigs(sigs, fmt="compact", curve=None):
+    """Concatenate many encoded signatures into one bytes object."""
+    return b"".join(encode_sig(sig, fmt, curve) for sig in sigs)
+
+
+def iter_decode_sigs(buffer, fmt="compact", curve=None):
+    """
+    Yield the signatures packed back to back in `buffer` (bytes, bytearray,
+    mmap, memoryview, ...). Scalars are read straight from memoryview
+    slices, which reference the buffer instead of copying it.
+    """
+    view = memoryview(buffer).cast('B')
+    if fmt == "compact":
+        size = _scalar_len(curve)
+        if len(view) % (2 * size):
+            raise ValueError(f"Buffer length is not a multiple of {2 * size}")
+        from_bytes = int.from_bytes
+        for i in range(0, len(view), 2 * size):
+            yield Signature(from_bytes(view[i:i + size], 'big'),
+                            from_bytes(view[i + size:i + 2 * size], 'big'))
+    elif fmt == "der":
+        i = 0
+        while i < len(view):
+            sig, i = _der_read_sig(view, i)
+            yield sig
+    else:
+        raise ValueError(f"Unknown signature format {fmt!r} (expected 'compact' or 'der')")
+
+
+def decode_sigs(buffer, fmt="compact", curve=None):
+    """All signatures in `buffer` as a list (see iter_decode_sigs)."""
+    return list(iter_decode_sigs(buffer, fmt, curve))
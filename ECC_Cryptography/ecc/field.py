@@ -0,0 +1,122 @@
+# ecc/field.py
+"""
+Prime-field arithmetic backends.
+
+A backend holds the modulus p and supplies inv and sqrt modulo p. The
+curve code does its multiplications and reductions inline (`x * y % p`),
+so the gmpy2 backend speeds it up by making p an mpz (mixed int/mpz
+arithmetic then runs in GMP) and by using gmpy2's invert and powmod. The
+backend is chosen once, at import time, from the ECC_FIELD_BACKEND
+environment variable:
+
+- "auto" (default): gmpy2 if it is installed, pure Python otherwise
+- "gmpy2": gmpy2 mpz arithmetic (ImportError if gmpy2 is missing)
+- "python": plain Python ints
+
+The standalone curve code in "Final Project/curve.py" and
+"Elgamal_Elliptic_Curve/ecc_elgamal/ecc_encoder.py" reads the same variable
+and uses an mpz modulus plus gmpy2 inversion in the same way.
+"""
+
+import os
+
+try:
+    import gmpy2
+except ImportError:  # optional dependency
+    gmpy2 = None
+
+
+class PythonField:
+    """Arithmetic modulo a prime p using Python ints."""
+
+    name = "python"
+
+    def __init__(self, p):
+        self.p = p
+
+    def inv(self, x):
+        if x % self.p == 0:
+            raise ZeroDivisionError("Cannot invert 0 in modular arithmetic.")
+        return pow(x, -1, self.p)
+
+    def _pow(self, x, e):
+        return pow(x, e, self.p)
+
+    def sqrt(self, x):
+        """
+        A square root of x mod p, or None if x is not a quadratic residue.
+        Uses the x^((p+1)/4) shortcut when p = 3 (mod 4), Tonelli-Shanks otherwise.
+        """
+        p = self.p
+        x %= p
+        if x == 0 or p == 2:
+            return x
+        if self._pow(x, (p - 1) // 2) != 1:
+            return None
+
+        if p % 4 == 3:
+            return self._pow(x, (p + 1) // 4)
+
+        # Tonelli-Shanks: write p - 1 = q * 2^s with q odd
+        q, s = p - 1, 0
+        while q % 2 == 0:
+            q //= 2
+            s += 1
+        z = 2
+        while self._pow(z, (p - 1) // 2) != p - 1:
+            z += 1
+
+        m = s
+        c = self._pow(z, q)
+        t = self._pow(x, q)
+        r = self._pow(x, (q + 1) // 2)
+        while t != 1:
+            # least i with t^(2^i) = 1
+            i, t2 = 0, t
+            while t2 != 1:
+                t2 = t2 * t2 % p
+                i += 1
+            b = self._pow(c, 1 << (m - i - 1))
+            m = i
+            c = b * b % p
+            t = t * c % p
+            r = r * b % p
+        return r
+
+
+class Gmpy2Field(PythonField):
+    """Arithmetic modulo a prime p using gmpy2 mpz integers."""
+
+    name = "gmpy2"
+
+    def __init__(self, p):
+        self.p = gmpy2.mpz(p)
+
+    def inv(self, x):
+        if x % self.p == 0:
+            raise ZeroDivisionError("Cannot invert 0 in modular arithmetic.")
+        return gmpy2.invert(x, self.p)
+
+    def _pow(self, x, e):
+        return gmpy2.powmod(x, e, self.p)
+
+
+def _select_backend(choice):
+    if choice == "python":
+        return PythonField
+    if choice == "gmpy2":
+        if gmpy2 is None:
+            raise ImportError("ECC_FIELD_BACKEND=gmpy2 but gmpy2 is not installed")
+        return Gmpy2Field
+    if choice == "auto":
+        return Gmpy2Field if gmpy2 is not None else PythonField
+    raise ValueError(f"Unknown ECC_FIELD_BACKEND {choice!r} (expected auto, gmpy2 or python)")
+
+
+Field = _select_backend(os.environ.get("ECC_FIELD_BACKEND", "auto").lower())
+BACKEND = Field.name
+
+
+def get_field(p):
+    """Field arithmetic modulo p using the backend selected at import time."""
+    return Field(p)
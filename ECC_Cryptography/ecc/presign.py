@@ -0,0 +1,183 @@
+# ecc/presign.py
+"""
+Presignature pool for low-latency ECDSA signing.
+
+A presignature (k, r = (k*G).x mod n, k^-1 mod n, recid) depends only on the
+curve, not on the key or the message, so it can be computed ahead of time.
+With one at hand, signing costs a hash and two multiplications mod n:
+
+    s = k^-1 * (z + r*d) mod n
+
+A background thread keeps the pool topped up: when it drops below
+low_water it refills to size, a batch at a time, with one Z inversion and
+one k inversion per batch (batch inversion). With process=True the batches
+are computed in a separate process, so the scalar multiplications do not
+compete with request threads for the GIL.
+
+    pool = PresignaturePool(curve, size=2048, low_water=512)
+    ecdsa.use_presignatures(pool)
+    sig = ecdsa.sign("pay bob 10")      # no scalar multiplication here
+
+Every presignature is handed out exactly once: reusing a nonce k leaks the
+private key (see ecc.attacks). Signatures made this way use random nonces,
+not RFC 6979.
+"""
+
+import collections
+import secrets
+import threading
+from concurrent.futures import ProcessPoolExecutor
+
+from .curve import EllipticCurve
+from .utils import batch_inverse
+
+# per-process curves for process=True workers, keyed by curve parameters
+_worker_curves = {}
+
+
+def make_presignatures(curve, count):
+    """`count` fresh presignatures (k, r, k_inv, recid), or fewer if r hit 0."""
+    n = curve.n
+    ks = [secrets.randbelow(n - 1) + 1 for _ in range(count)]
+    points = curve.batch_normalize(curve.scalar_mult(k, curve.G) for k in ks)
+    k_invs = batch_inverse(ks, n)
+
+    presignatures = []
+    for k, k_inv, P in zip(ks, k_invs, points):
+        if P is curve.O or P.x % n == 0:
+            continue
+        presignatures.append((k, P.x % n, k_inv, (P.y & 1) | (P.x // n) << 1))
+    return presignatures
+
+
+def _remote_batch(params, count):
+    curve = _worker_curves.get(params)
+    if curve is None:
+        curve = _worker_curves[params] = EllipticCurve(*params)
+    return make_presignatures(curve, count)
+
+
+class PresignaturePool:
+    """
+    Thread-safe pool of presignatures for one curve, refilled in the
+    background. hits / misses count take() calls served from the pool and
+    computed on the spot because the pool was empty.
+
+    If a refill fails, the filler keeps running: the exception is kept in
+    `error` (and counted in `errors`, both reported by stats()) and the
+    refill is retried on the next wake-up. A worker process that dies
+    (process=True) is dropped and batches are computed in the filler
+    thread from then on.
+    """
+
+    def __init__(self, curve, size=1024, low_water=256, batch=64, process=False):
+        if not 0 <= low_water < size:
+            raise ValueError("Need 0 <= low_water < size")
+        if batch < 1:
+            raise ValueError("batch must be at least 1")
+        self.curve = curve
+        self.size = size
+        self.low_water = low_water
+        self.batch = batch
+        self.hits = 0
+        self.misses = 0
+        self.errors = 0
+        self.error = None  # last exception raised while refilling
+
+        self._items = collections.deque()
+        self._lock = threading.Lock()
+        self._wake = threading.Event()
+        self._closed = False
+        self._executor = ProcessPoolExecutor(1) if process else None
+        self._params = (curve.p, curve.a, curve.b, curve.G.x, curve.G.y, curve.n)
+
+        self._wake.set()  # fill up right away
+        self._thread = threading.Thread(target=self._run, name="presign-filler", daemon=True)
+        self._thread.start()
+
+    def __len__(self):
+        return len(self._items)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def _make(self, count):
+        if self._executor is None:
+            return make_presignatures(self.curve, count)
+        return self._executor.submit(_remote_batch, self._params, count).result()
+
+    def _run(self):
+        while True:
+            self._wake.wait()
+            if self._closed:
+                return
+            self._wake.clear()
+            while not self._closed and len(self._items) < self.size:
+                try:
+                    batch = self._make(min(self.batch, self.size - len(self._items)))
+                except Exception as exc:
+                    self._refill_failed(exc)
+                    break
+                self._items.extend(batch)
+
+    def _refill_failed(self, exc):
+        with self._lock:
+            self.errors += 1
+            self.error = exc
+        executor = self._executor
+        if executor is not None:
+            # e.g. BrokenProcessPool: carry on in this thread
+            self._executor = None
+            executor.shutdown(wait=False)
+            self._wake.set()
+
+    def fill(self):
+        """Top the pool up to `size` in the calling thread (e.g. at startup)."""
+        while len(self._items) < self.size:
+            self._items.extend(make_presignatures(self.curve, min(self.batch, self.size - len(self._items))))
+
+    def take(self):
+        """Remove and return one presignature (k, r, k_inv, recid)."""
+        try:
+            item = self._items.popleft()
+        except IndexError:
+            item = None
+        with self._lock:
+            if item is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+        if len(self._items) < self.low_water:
+            self._wake.set()
+
+        while item is None:
+            fresh = make_presignatures(self.curve, 1)
+            item = fresh[0] if fresh else None
+        return item
+
+    def stats(self):
+        """Hit/miss counters and the current fill level."""
+        with self._lock:
+            hits, misses = self.hits, self.misses
+        total = hits + misses
+        return {
+            "hits": hits,
+            "misses": misses,
+            "hit_rate": hits / total if total else 0.0,
+            "available": len(self._items),
+            "size": self.size,
+            "low_water": self.low_water,
+            "errors": self.errors,
+            "error": self.error,
+        }
+
+    def close(self):
+        """Stop the background filler (and its worker process)."""
+        self._closed = True
+        self._wake.set()
+        self._thread.join()
+        if self._executor is not None:
+            self._executor.shutdown()
@@ -21,45 +21,65 @@ def bits2octets(b, qlen, q):
     return int2octets(z2 % q, (qlen + 7) // 8)
 
 
-def rfc6979_generate_k(msg_hash, private_key, q):
+class RFC6979:
     """
-    Deterministic k generation per RFC 6979.
-    msg_hash: bytes
-    private_key: int
-    q: curve order
+    Deterministic nonce generator for one private key (RFC 6979, HMAC-SHA256).
+
+    Everything that depends only on the key is computed once: the octets of
+    x, and the first HMAC (key K = 0x00..00) already fed with V || 0x00 || bx,
+    so each nonce starts from a .copy() of it. The remaining HMACs depend on
+    the message and use the one-shot hmac.digest.
     """
-    qlen = q.bit_length()
-    rlen = (qlen + 7) // 8
 
-    x = private_key
-    h1 = msg_hash
+    def __init__(self, private_key, q):
+        self.q = q
+        self.qlen = q.bit_length()
+        self.rlen = (self.qlen + 7) // 8
+        self.bx = int2octets(private_key, self.rlen)
+
+        V = b'\x01' * 32
+        K = b'\x00' * 32
+        self._first = hmac.new(K, V + b'\x00' + self.bx, hashlib.sha256)
+
+    def nonces(self, msg_hash):
+        """Yield the RFC 6979 candidates k in [1, q) for msg_hash (bytes)."""
+        q, qlen, rlen = self.q, self.qlen, self.rlen
+        bh = bits2octets(msg_hash, self.qlen, q)
 
-    # Step: Convert x and h1 to octets
-    bx = int2octets(x, rlen)
-    bh = bits2octets(h1, qlen, q)
+        # K = HMAC_K(V || 0x00 || bx || bh), V = HMAC_K(V)
+        h = self._first.copy()
+        h.update(bh)
+        K = h.digest()
+        V = hmac.digest(K, b'\x01' * 32, 'sha256')
 
-    # Step: Initialize V and K
-    V = b'\x01' * 32
-    K = b'\x00' * 32
+        # K = HMAC_K(V || 0x01 || bx || bh), V = HMAC_K(V)
+        K = hmac.digest(K, V + b'\x01' + self.bx + bh, 'sha256')
+        V = hmac.digest(K, V, 'sha256')
 
-    # Step: K = HMAC_K(V || 0x00 || bx || bh)
-    K = hmac.new(K, V + b'\x00' + bx + bh, hashlib.sha256).digest()
-    V = hmac.new(K, V, hashlib.sha256).digest()
+        while True:
+            T = b''
+            while len(T) < rlen:
+                V = hmac.digest(K, V, 'sha256')
+                T += V
 
-    # Step: K = HMAC_K(V || 0x01 || bx || bh)
-    K = hmac.new(K, V + b'\x01' + bx + bh, hashlib.sha256).digest()
-    V = hmac.new(K, V, hashlib.sha256).digest()
+            # bits2int(T): the leftmost qlen bits of T
+            k = int.from_bytes(T, 'big') >> (len(T) * 8 - qlen)
+            if 1 <= k < q:
+                yield k
 
-    # Loop
-    while True:
-        T = b''
-        while len(T) < rlen:
-            V = hmac.new(K, V, hashlib.sha256).digest()
-            T += V
+            K = hmac.digest(K, V + b'\x00', 'sha256')
+            V = hmac.digest(K, V, 'sha256')
 
-        k = int.from_bytes(T[:rlen], 'big')
-        if 1 <= k < q:
-            return k  # Valid RFC 6979 nonce
+    def generate_k(self, msg_hash):
+        """The first RFC 6979 nonce for msg_hash."""
+        return next(self.nonces(msg_hash))
 
-        K = hmac.new(K, V + b'\x00', hashlib.sha256).digest()
-        V = hmac.new(K, V, hashlib.sha256).digest()
+
+def rfc6979_generate_k(msg_hash, private_key, q):
+    """
+    Deterministic k generation per RFC 6979.
+    msg_hash: bytes
+    private_key: int
+    q: curve order
+    """
+    return RFC6979(private_key, q).generate_k(msg_hash)
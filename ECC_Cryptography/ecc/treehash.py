@@ -0,0 +1,161 @@
+# ecc/treehash.py
+"""
+Tree-hash (Merkle) digests for signing very large files.
+
+The file is cut into fixed-size chunks that are hashed in a thread pool
+(hashlib releases the GIL while hashing, so this scales across cores), and
+a Merkle tree is built over the chunk hashes:
+
+    leaf = SHA-256(0x00 || chunk)
+    node = SHA-256(0x01 || left || right)     (an odd last node moves up as is)
+    digest = SHA-256(0x02 || chunk_size || file_size || root)
+
+The 0x00 / 0x01 / 0x02 prefixes keep leaves, inner nodes and the final
+digest from ever being confused with one another. The digest is what gets
+signed; a chunk can later be checked against the root with its Merkle
+proof, without reading the rest of the file. The chunk's position comes
+from its index and the leaf count (which the digest fixes through the file
+size and chunk size), so a proof for one chunk does not verify another.
+
+    tree, sig = treehash.sign_file(ecdsa, "archive.tar")
+    treehash.verify_file(ecdsa, "archive.tar", sig, Q)
+    proof = tree.proof(7)
+    treehash.verify_chunk(chunk_7_bytes, 7, proof, tree.root, len(tree.leaves))
+"""
+
+import hashlib
+import mmap
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+DEFAULT_CHUNK_SIZE = 4 << 20  # 4 MiB
+
+_LEAF = b"\x00"
+_NODE = b"\x01"
+_DIGEST = b"\x02"
+
+
+def leaf_hash(chunk) -> bytes:
+    h = hashlib.sha256(_LEAF)
+    h.update(chunk)
+    return h.digest()
+
+
+def node_hash(left: bytes, right: bytes) -> bytes:
+    return hashlib.sha256(_NODE + left + right).digest()
+
+
+def leaf_count(size: int, chunk_size: int) -> int:
+    """Number of leaves of the tree over `size` bytes (an empty file has one)."""
+    return max(1, -(-size // chunk_size))
+
+
+class TreeHash:
+    """Merkle tree over the chunk hashes of one file (or bytes object)."""
+
+    def __init__(self, leaves, chunk_size: int, size: int):
+        self.chunk_size = chunk_size
+        self.size = size
+        self.levels = [list(leaves) or [leaf_hash(b"")]]
+        while len(self.levels[-1]) > 1:
+            level = self.levels[-1]
+            parents = [node_hash(level[i], level[i + 1]) for i in range(0, len(level) - 1, 2)]
+            if len(level) % 2:
+                parents.append(level[-1])
+            self.levels.append(parents)
+
+    @classmethod
+    def from_bytes(cls, data, chunk_size: int = DEFAULT_CHUNK_SIZE, workers=None):
+        view = memoryview(data)
+        return cls(_hash_chunks(view, chunk_size, workers), chunk_size, len(view))
+
+    @classmethod
+    def from_file(cls, path, chunk_size: int = DEFAULT_CHUNK_SIZE, workers=None):
+        """Hash a file's chunks from an mmap of it, in `workers` threads."""
+        with open(path, "rb") as f:
+            size = os.fstat(f.fileno()).st_size
+            if size == 0:
+                return cls([], chunk_size, 0)
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                leaves = _hash_chunks(mm, chunk_size, workers)
+        return cls(leaves, chunk_size, size)
+
+    @property
+    def leaves(self):
+        return self.levels[0]
+
+    @property
+    def root(self) -> bytes:
+        return self.levels[-1][0]
+
+    @property
+    def digest(self) -> bytes:
+        """The value that is signed: binds the root to the chunk size and file size."""
+        header = self.chunk_size.to_bytes(8, "big") + self.size.to_bytes(8, "big")
+        return hashlib.sha256(_DIGEST + header + self.root).digest()
+
+    def proof(self, index: int):
+        """
+        Merkle proof for chunk `index`: the sibling hashes from the leaf up.
+        Levels where the node has no sibling (an odd last node) are skipped.
+        """
+        if not 0 <= index < len(self.leaves):
+            raise IndexError("chunk index out of range")
+        proof = []
+        for level in self.levels[:-1]:
+            sibling = index ^ 1
+            if sibling < len(level):
+                proof.append(level[sibling])
+            index //= 2
+        return proof
+
+
+def _hash_chunks(buffer, chunk_size, workers):
+    """Leaf hashes of consecutive chunk_size slices of a buffer, in a thread pool."""
+    if chunk_size <= 0:
+        raise ValueError("chunk_size must be positive")
+    size = len(buffer)
+
+    def hash_at(offset):
+        with memoryview(buffer) as view:
+            with view[offset:offset + chunk_size] as chunk:
+                return leaf_hash(chunk)
+
+    offsets = range(0, size, chunk_size)
+    if len(offsets) <= 1 or workers == 1:
+        return [hash_at(offset) for offset in offsets]
+    with ThreadPoolExecutor(max_workers=workers or os.cpu_count()) as pool:
+        return list(pool.map(hash_at, offsets))
+
+
+def verify_chunk(chunk, index: int, proof, root: bytes, leaves: int) -> bool:
+    """
+    Check that `chunk` is chunk number `index` of the tree with Merkle root
+    `root` and `leaves` leaves (see leaf_count), using its proof. Left/right
+    at each level follows from the index, never from the proof.
+    """
+    if not 0 <= index < leaves:
+        return False
+    h = leaf_hash(chunk)
+    siblings = iter(proof)
+    while leaves > 1:
+        if index ^ 1 < leaves:
+            sibling = next(siblings, None)
+            if sibling is None:
+                return False
+            h = node_hash(sibling, h) if index & 1 else node_hash(h, sibling)
+        index >>= 1
+        leaves = (leaves + 1) // 2
+    return next(siblings, None) is None and h == root
+
+
+def sign_file(ecdsa, path, chunk_size: int = DEFAULT_CHUNK_SIZE, workers=None):
+    """Tree-hash a file and sign its digest; returns (tree, signature)."""
+    tree = TreeHash.from_file(path, chunk_size, workers)
+    return tree, ecdsa.sign_digest(tree.digest)
+
+
+def verify_file(ecdsa, path, sig, Q, chunk_size: int = DEFAULT_CHUNK_SIZE, workers=None) -> bool:
+    """Verify a signature made by sign_file (the chunk size must match)."""
+    tree = TreeHash.from_file(path, chunk_size, workers)
+    return ecdsa.verify_digest(tree.digest, sig, Q)
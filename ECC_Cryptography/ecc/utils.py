@@ -1,9 +1,78 @@
 # ecc/utils.py
 import hashlib
+import mmap
+import os
 
-def sha256_int(msg: str) -> int:
-    return int.from_bytes(hashlib.sha256(msg.encode()).digest(), 'big')
+# read size for hashing file objects
+HASH_CHUNK_SIZE = 1 << 20
+
+
+def _as_bytes(msg):
+    """str is UTF-8 encoded; bytes, bytearray and memoryview pass through."""
+    return msg.encode() if isinstance(msg, str) else msg
+
+def sha256_int(msg) -> int:
+    return int.from_bytes(hashlib.sha256(_as_bytes(msg)).digest(), 'big')
 
 # small helper alias
-def sha256_bytes(msg: str) -> bytes:
-    return hashlib.sha256(msg.encode()).digest()
+def sha256_bytes(msg) -> bytes:
+    return hashlib.sha256(_as_bytes(msg)).digest()
+
+
+def sha256_stream(fileobj, chunk_size: int = HASH_CHUNK_SIZE) -> bytes:
+    """
+    SHA-256 digest of everything left in a binary file object, read in
+    chunks into one reused buffer (no copy of the whole payload in memory).
+    """
+    h = hashlib.sha256()
+    buf = bytearray(chunk_size)
+    view = memoryview(buf)
+    readinto = getattr(fileobj, "readinto", None)
+    while True:
+        if readinto is not None:
+            n = readinto(buf)
+            if not n:
+                break
+            h.update(view[:n])
+        else:
+            chunk = fileobj.read(chunk_size)
+            if not chunk:
+                break
+            h.update(chunk)
+    return h.digest()
+
+
+def sha256_file(path) -> bytes:
+    """SHA-256 digest of a file, hashed straight from an mmap of it."""
+    with open(path, "rb") as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return hashlib.sha256(b"").digest()
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            return hashlib.sha256(mm).digest()
+
+
+def batch_inverse(values, modulus):
+    """
+    Invert every value modulo `modulus` using Montgomery's trick:
+    one modular inversion plus about 3N multiplications for N values.
+    Works for field elements (mod p) as well as scalars (mod n).
+    """
+    values = [v % modulus for v in values]
+    if not values:
+        return []
+
+    # prefix[i] = values[0] * ... * values[i-1]
+    prefix = []
+    acc = 1
+    for v in values:
+        if v == 0:
+            raise ZeroDivisionError("Cannot invert 0 in modular arithmetic.")
+        prefix.append(acc)
+        acc = acc * v % modulus
+
+    inv = pow(acc, -1, modulus)
+    result = [0] * len(values)
+    for i in range(len(values) - 1, -1, -1):
+        result[i] = inv * prefix[i] % modulus
+        inv = inv * values[i] % modulus
+    return result
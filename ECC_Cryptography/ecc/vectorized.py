@@ -0,0 +1,164 @@
+# ecc/vectorized.py
+"""
+NumPy-vectorized point arithmetic for small-field curves (p < 2^31).
+
+A PointArray holds a batch of affine points on one curve as int64 arrays;
++, double() and * work element-wise on the whole batch, with one batched
+field inversion (product tree) per operation. Products of two reduced
+elements stay below 2^62, so int64 never overflows.
+
+    from ecc import curves
+    from ecc.vectorized import PointArray, scalar_mult
+
+    curve = curves.get("toy9739")
+    ks = numpy.random.randint(1, curve.n, size=10_000)
+    R = scalar_mult(ks, curve.G)          # 10,000 multiples of G at once
+    points = R.to_points()                # back to ecc Point objects
+
+NumPy is an optional dependency; this module is not imported by `ecc`.
+"""
+
+try:
+    import numpy as np
+except ImportError as exc:  # optional dependency
+    raise ImportError("ecc.vectorized needs NumPy (pip install numpy)") from exc
+
+from .curve import Point
+
+MAX_P = 1 << 31
+
+
+def batch_inverse(values, p):
+    """
+    Element-wise inverses mod p of an int64 array, using a product tree:
+    pairwise products up to the root, one scalar inversion, then back down
+    (inverse of a child = inverse of its parent * its sibling).
+    """
+    values = np.asarray(values, dtype=np.int64) % p
+    if values.size == 0:
+        return values
+    if not values.all():
+        raise ZeroDivisionError("Cannot invert 0 in modular arithmetic.")
+
+    levels = [values]
+    while len(levels[-1]) > 1:
+        level = levels[-1]
+        if len(level) % 2:
+            level = np.append(level, 1)
+        levels.append(level[0::2] * level[1::2] % p)
+
+    inv = np.array([pow(int(levels[-1][0]), -1, p)], dtype=np.int64)
+    for level in reversed(levels[:-1]):
+        size = len(level)
+        if size % 2:
+            level = np.append(level, 1)
+        siblings = level.reshape(-1, 2)[:, ::-1].reshape(-1)
+        inv = (np.repeat(inv, 2) * siblings % p)[:size]
+    return inv
+
+
+class PointArray:
+    """
+    A batch of points on one curve: affine x, y (int64 arrays) and a boolean
+    mask marking points at infinity (whose x, y are 0). Length-1 batches
+    broadcast against longer ones.
+    """
+
+    def __init__(self, curve, x, y, inf=None):
+        if curve.p >= MAX_P:
+            raise ValueError(f"PointArray needs p < 2^31, got a {curve.p.bit_length()}-bit p")
+        self.curve = curve
+        self.x = np.asarray(x, dtype=np.int64)
+        self.y = np.asarray(y, dtype=np.int64)
+        self.inf = np.zeros(self.x.shape, dtype=bool) if inf is None else np.asarray(inf, dtype=bool)
+
+    @classmethod
+    def from_points(cls, points, curve=None):
+        """Build a batch from ecc Point objects (all on the same curve)."""
+        points = list(points)
+        if curve is None:
+            curve = points[0].curve
+        curve.batch_normalize(points)
+        inf = [P._Z == 0 for P in points]
+        x = [0 if i else P.x for P, i in zip(points, inf)]
+        y = [0 if i else P.y for P, i in zip(points, inf)]
+        return cls(curve, x, y, inf)
+
+    def to_points(self):
+        """The batch as a list of ecc Point objects."""
+        curve = self.curve
+        return [
+            curve.O if i else Point(int(x), int(y), curve)
+            for x, y, i in zip(self.x.tolist(), self.y.tolist(), self.inf.tolist())
+        ]
+
+    def __len__(self):
+        return len(self.x)
+
+    def __repr__(self):
+        return f"PointArray({len(self)} points, p={self.curve.p})"
+
+    @staticmethod
+    def select(mask, A, B):
+        """Element-wise A where mask is True, B elsewhere."""
+        return PointArray(
+            A.curve,
+            np.where(mask, A.x, B.x),
+            np.where(mask, A.y, B.y),
+            np.where(mask, A.inf, B.inf),
+        )
+
+    def __neg__(self):
+        return PointArray(self.curve, self.x, (-self.y) % self.curve.p, self.inf)
+
+    def __add__(self, other):
+        p = self.curve.p
+        x1, y1, inf1 = self.x, self.y, self.inf
+        x2, y2, inf2 = other.x, other.y, other.inf
+
+        same_x = x1 == x2
+        dbl = same_x & (y1 == y2) & (y1 != 0)
+        cancel = same_x & ~dbl  # P + (-P), or 2P for a point with y = 0
+        chord = ~(inf1 | inf2 | cancel)
+
+        # slope: (3x^2 + a) / 2y for doublings, (y2 - y1) / (x2 - x1) otherwise
+        num = np.where(dbl, (3 * (x1 * x1 % p) + self.curve.a) % p, (y2 - y1) % p)
+        den = np.where(dbl, 2 * y1 % p, (x2 - x1) % p)
+        den = np.where(chord, den, 1)
+        lam = num * batch_inverse(den, p) % p
+
+        x3 = (lam * lam - x1 - x2) % p
+        y3 = (lam * (x1 - x3) - y1) % p
+        inf = (inf1 & inf2) | (~inf1 & ~inf2 & cancel)
+        x = np.where(inf1, x2, np.where(inf2, x1, x3))
+        y = np.where(inf1, y2, np.where(inf2, y1, y3))
+        x = np.where(inf, 0, x)
+        y = np.where(inf, 0, y)
+        return PointArray(self.curve, x, y, inf)
+
+    def double(self):
+        return self + self
+
+    def __mul__(self, k):
+        """
+        Element-wise k * P, where k is an int or an array of non-negative
+        ints below 2^63; left-to-right double-and-add over the whole batch.
+        """
+        ks = np.asarray(k, dtype=np.int64)
+        if (ks < 0).any():
+            raise ValueError("scalars must be non-negative")
+        shape = np.broadcast_shapes(ks.shape, self.x.shape)
+        R = PointArray(self.curve, np.zeros(shape), np.zeros(shape), np.ones(shape, dtype=bool))
+        for bit in range(int(ks.max(initial=0)).bit_length() - 1, -1, -1):
+            R = R.double()
+            R = PointArray.select((ks >> bit) & 1 == 1, R + self, R)
+        return R
+
+    __rmul__ = __mul__
+
+
+def scalar_mult(ks, P):
+    """k * P for every k in ks; P is a Point or a PointArray."""
+    if isinstance(P, Point):
+        P = PointArray.from_points([P])
+    return P * ks
@@ -1,16 +1,12 @@
 from ecc.keys import ECCKeyPair
 from ecc.ecdsa import ECDSA
-from ecc.curve import EllipticCurve
+from ecc import curves
 from datetime import datetime
 import json
 import hashlib
 
 # Realistic curve (small to compute fast)
-curve = EllipticCurve(
-    p=257, a=1, b=1,
-    Gx=3, Gy=10,
-    n=251
-)
+curve = curves.get("toy257")
 
 class BankingApp:
     def __init__(self):
@@ -39,5 +35,11 @@ class BankingApp:
         message = json.dumps(tx)
         return self.ecdsa.verify(message, signature, self.public_key)
 
+    def verify_transactions(self, signed):
+        """Verify a list of (tx, signature) pairs; returns one bool per pair."""
+        return self.ecdsa.verify_batch(
+            (json.dumps(tx), signature, self.public_key) for tx, signature in signed
+        )
+
     def deduct_funds(self, amount):
         self.balance -= amount
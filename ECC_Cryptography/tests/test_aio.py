@@ -0,0 +1,24 @@
+#tests/test_aio.py
+
+import asyncio
+
+from ecc import curves
+from ecc.aio import AsyncVerifier
+from ecc.ecdsa import ECDSA
+
+
+def test_async_verifier_batches_requests():
+    curve = curves.get("secp256k1")
+    ecdsa = ECDSA(curve, private_key=1234, public_key=1234 * curve.G)
+    items = [(f"order {i}", ecdsa.sign(f"order {i}")) for i in range(20)]
+
+    async def main():
+        async with AsyncVerifier(curve, max_batch=8, workers=1) as verifier:
+            checks = [verifier.verify(m, sig, ecdsa.public_key) for m, sig in items]
+            checks.append(verifier.verify("tampered", items[0][1], ecdsa.public_key))
+            results = await asyncio.gather(*checks)
+            return results, verifier.batches
+
+    results, batches = asyncio.run(main())
+    assert results == [True] * 20 + [False]
+    assert batches == 3
@@ -0,0 +1,20 @@
+#tests/test_batch.py
+
+from ecc import batch, curves
+from ecc.ecdsa import ECDSA
+
+
+def test_sign_many_matches_single_signing():
+    curve = curves.get("secp256k1")
+    d = 0xC0FFEE
+    messages = [f"settlement {i}" for i in range(30)] + [b"raw bytes"]
+    sigs = batch.sign_many(d, messages, workers=2, chunk_size=4)
+    ecdsa = ECDSA(curve, private_key=d, public_key=d * curve.G)
+    assert sigs == [ecdsa.sign(m) for m in messages]
+    assert all(ecdsa.verify(m, s, ecdsa.public_key) for m, s in zip(messages, sigs))
+
+def test_iter_sign_many_in_process_on_toy_curve():
+    curve = curves.get("toy9739")
+    sigs = list(batch.iter_sign_many(77, (str(i) for i in range(10)), curve=curve, workers=1))
+    ecdsa = ECDSA(curve, private_key=77)
+    assert sigs == [ecdsa.sign(str(i)) for i in range(10)]
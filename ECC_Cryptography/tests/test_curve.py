@@ -1,6 +1,9 @@
 #tests/test_curve.py
 
 
+import sys
+import threading
+
 import pytest 
 from ecc.curve import EllipticCurve, Point
 
@@ -20,3 +23,136 @@ def test_scalar_mult():
     P = Point(3, 10, curve)
     R = curve.scalar_mult(2, P)
     assert isinstance(R, Point)
+
+def test_jacobian_matches_affine():
+    # Textbook values for y^2 = x^3 + x + 1 over F_23
+    P = Point(3, 10, curve)
+    assert (2 * P).x == 7 and (2 * P).y == 12
+    assert (3 * P).x == 19 and (3 * P).y == 5
+    assert P + P + P == 3 * P
+
+def test_fixed_base_table_matches_generic():
+    G = curve.G
+    G_copy = Point(G.x, G.y, curve)  # not `is curve.G`, so no table
+    for k in range(1, 3 * curve.n):
+        assert k * G == k * G_copy
+
+def test_fixed_base_table_is_built_once():
+    big = EllipticCurve(p=2**127 - 1, a=1, b=1, Gx=0, Gy=1, n=2**127)  # n is only a size hint here
+    table = big.fixed_base_table()
+    assert table is big.fixed_base_table()
+    assert table[0][1] == big.G and table[1][1] == 16 * Point(0, 1, big)  # not via the table
+
+def test_wnaf_matches_double_and_add():
+    wnaf_curve = EllipticCurve(p=23, a=1, b=1, Gx=3, Gy=10, n=7)
+    wnaf_curve.wnaf_min_bits = 1
+    P = Point(3, 10, curve)
+    P_w = Point(3, 10, wnaf_curve)
+    for k in range(1, 100):
+        R, R_w = k * P, k * P_w
+        assert (R.x, R.y) == (R_w.x, R_w.y)
+
+def test_multi_scalar_mult_matches_separate_products():
+    G = curve.G
+    Q = 5 * G
+    for u1, u2 in [(3, 4), (11, 0), (0, 9), (25, 17), (6, -2)]:
+        expected = u1 * G + (u2 * Q if u2 >= 0 else -((-u2) * Q))
+        assert curve.multi_scalar_mult([(u1, G), (u2, Q)]) == expected
+
+def test_glv_split_and_mult_on_secp256k1():
+    secp = EllipticCurve(
+        p=0xFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFEFFFFFC2F,
+        a=0, b=7,
+        Gx=55066263022277343669578718895168534326250603453777594175500187360389116729240,
+        Gy=32670510020758816978083085130507043184471273380659243275938904335757337482424,
+        n=0xFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFEBAAEDCE6AF48A03BBFD25E8CD0364141
+    )
+    assert secp._glv is not None
+    lam = secp._glv["lambda"]
+    k = 0x1D5ED2BBE5D0A0C39E27BD0E69F5A5FA3A9DB37D2F5F8C5A1E0B2C3A4F5E6D7C
+    k1, k2 = secp._glv_split(k)
+    assert (k1 + k2 * lam) % secp.n == k
+    assert max(abs(k1), abs(k2)).bit_length() <= 129
+
+    Q = 7 * secp.G
+    plain = EllipticCurve(secp.p, 0, 7, secp.G.x, secp.G.y, secp.n)
+    plain._glv = None
+    R, R_plain = k * Q, k * Point(Q.x, Q.y, plain)
+    assert (R.x, R.y) == (R_plain.x, R_plain.y)
+
+def test_msm_matches_naive_sum():
+    msm_curve = EllipticCurve(p=23, a=1, b=1, Gx=3, Gy=10, n=7)
+    msm_curve.msm_strauss_threshold = 0  # force the bucket path
+    G = msm_curve.G
+    scalars = [3, 0, 17, 250, -5, 64, 1]
+    points = [k * G for k in range(1, len(scalars) + 1)]
+    expected = msm_curve.O
+    for k, P in zip(scalars, points):
+        expected = expected + (k * P if k >= 0 else -((-k) * P))
+    assert msm_curve.msm(scalars, points) == expected
+
+def test_points_are_hashable_and_infinity_is_interned():
+    P = Point(3, 10, curve)
+    assert Point(None, None, curve) is curve.O
+    assert P + (-P) is curve.O
+    assert {2 * P: "double"}[P + P] == "double"  # Jacobian vs affine form
+
+    other = EllipticCurve(p=23, a=1, b=1, Gx=3, Gy=10, n=7)
+    assert Point(3, 10, other) == P  # equal parameters, equal curves
+    assert Point(3, 10, EllipticCurve(p=23, a=1, b=1, Gx=3, Gy=10, n=28)) != P
+    assert not hasattr(P, "__dict__")
+
+def test_pickle_and_copy_round_trip():
+    import copy
+    import pickle
+    from ecc import curves
+    secp = curves.get("secp256k1")
+    for Q in (5 * secp.G, secp.O, 3 * Point(3, 10, curve), curve.O):
+        for R in (pickle.loads(pickle.dumps(Q)), copy.deepcopy(Q)):
+            assert R == Q
+    assert pickle.loads(pickle.dumps(5 * secp.G)).curve is secp
+    assert pickle.loads(pickle.dumps(secp.O)) is secp.O
+
+def test_batch_normalize():
+    P = Point(3, 10, curve)
+    points = [2 * P, 3 * P, P + P + P + P, curve.O]
+    expected = [(Q.x, Q.y) for Q in [Point(7, 12, curve), Point(19, 5, curve), 4 * P, curve.O]]
+    curve.batch_normalize(points)
+    assert all(Q._Z in (0, 1) for Q in points)
+    assert [(Q.x, Q.y) for Q in points] == expected
+
+def test_concurrent_normalization_is_consistent():
+    from ecc import curves
+    secp = curves.get("secp256k1")
+    points = [k * secp.G for k in range(2, 402)]
+    expected = [(Q.x, Q.y) for Q in (k * secp.G for k in range(2, 402))]
+    results = [[], []]
+
+    def read(out):
+        out.extend((Q.x, Q.y) for Q in points)
+
+    interval = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)
+    try:
+        threads = [threading.Thread(target=read, args=(out,)) for out in results]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+    finally:
+        sys.setswitchinterval(interval)
+    assert results[0] == results[1] == expected
+
+def test_small_field_lookup_tables():
+    generic = EllipticCurve(p=23, a=1, b=1, Gx=3, Gy=10, n=7)
+    generic._small = generic._inv_table = False
+    points = [(x, y) for x in range(23) for y in range(23) if (y * y - x ** 3 - x - 1) % 23 == 0]
+    for x, y in points:
+        for k in range(1, 40):
+            R = curve.scalar_mult(k, Point(x, y, curve))
+            S = generic.scalar_mult(k, Point(x, y, generic))
+            assert (R.x, R.y) == (S.x, S.y)
+
+    assert all(curve.inverse_mod(i) * i % 23 == 1 for i in range(1, 23))
+    assert curve.discrete_log(Point(19, 5, curve)) == 3
+    assert curve.discrete_log(curve.O) == 0
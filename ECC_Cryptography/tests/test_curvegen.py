@@ -0,0 +1,25 @@
+#tests/test_curvegen.py
+
+import random
+
+from ecc import curvegen, curves
+
+
+def test_bsgs_and_schoof_match_naive_count():
+    rng = random.Random(1)
+    for _ in range(20):
+        p = curvegen.random_prime(12, rng)
+        a, b = rng.randrange(p), rng.randrange(1, p)
+        if (4 * a ** 3 + 27 * b ** 2) % p == 0:
+            continue
+        N = curvegen.count_points_naive(p, a, b)
+        assert curvegen.count_points_bsgs(p, a, b, rng) == N
+        assert curvegen.count_points_schoof(p, a, b) == N
+
+def test_generate_curve_is_cached_and_valid(tmp_path):
+    path = str(tmp_path / "curves.json")
+    curve = curvegen.generate_curve(24, cache_path=path, rng=random.Random(2))
+    curves.validate(curve)
+    assert curvegen.is_probable_prime(curve.n)
+    again = curvegen.generate_curve(24, cache_path=path)
+    assert (again.p, again.a, again.b, again.n) == (curve.p, curve.a, curve.b, curve.n)
@@ -0,0 +1,24 @@
+#tests/test_curves.py
+
+import pytest
+from ecc import curves
+from ecc.curve import EllipticCurve
+
+
+def test_get_returns_shared_validated_curve():
+    curve = curves.get("secp256k1")
+    assert curves.get("secp256k1") is curve
+    assert curve.scalar_mult(curve.n, curve.G) is curve.O
+
+def test_toy_curves_have_correct_order():
+    for name in ("toy23", "toy257", "toy9739"):
+        curve = curves.get(name)
+        assert curve.n * curve.G is curve.O
+        assert all(k * curve.G is not curve.O for k in range(1, curve.n))
+
+def test_validate_rejects_wrong_order():
+    bad = EllipticCurve(p=9739, a=497, b=1768, Gx=1804, Gy=5368, n=9739)
+    with pytest.raises(ValueError):
+        curves.validate(bad)
+    with pytest.raises(KeyError):
+        curves.get("no-such-curve")
@@ -0,0 +1,18 @@
+#tests/test_dlp.py
+
+import random
+
+from ecc import curvegen, curves, dlp
+
+
+def test_brute_force_on_toy_curve():
+    curve = curves.get("toy9739")
+    assert dlp.brute_force_dlog(curve, 1234 * curve.G) == 1234
+    assert dlp.pollard_rho(curve, 4321 * curve.G) == 4321
+
+def test_pollard_rho_recovers_key(tmp_path):
+    curve = curvegen.generate_curve(28, cache_path=str(tmp_path / "c.json"), rng=random.Random(3))
+    k = random.Random(4).randrange(1, curve.n)
+    Q = k * curve.G
+    assert dlp.pollard_rho(curve, Q, workers=1, seed=1) == k
+    assert dlp.pollard_rho(curve, Q, workers=2, seed=2) == k
@@ -15,13 +15,13 @@ curve = EllipticCurve(
 )
 
 def test_sign_and_verify_random():
-    """Test ECDSA signing and verification with normal random k"""
+    """Test ECDSA signing and verification with the default RFC 6979 nonce"""
     kp = ECCKeyPair(curve)
     d, Q = kp.generate_keys()
     ecdsa = ECDSA(curve, private_key=d, public_key=Q)
 
     msg = "hello"
-    sig = ecdsa.sign(msg)  # normal random k
+    sig = ecdsa.sign(msg)  # deterministic RFC 6979 k
     assert ecdsa.verify(msg, sig, Q)
 
 def test_sign_and_verify_deterministic():
@@ -34,3 +34,148 @@ def test_sign_and_verify_deterministic():
     fixed_k = 123456789  # deterministic k for testing
     sig = ecdsa.sign(msg, k=fixed_k)
     assert ecdsa.verify(msg, sig, Q)
+
+def test_verify_batch_finds_bad_signatures():
+    kp = ECCKeyPair(curve)
+    d, Q = kp.generate_keys()
+    ecdsa = ECDSA(curve, private_key=d, public_key=Q)
+
+    items = []
+    for i in range(40):
+        k = 1000 + i
+        R = k * curve.G
+        recid = (R.y & 1) | (2 if R.x >= curve.n else 0)
+        items.append((f"tx {i}", ecdsa.sign(f"tx {i}", k=k), Q, recid))
+    items[5] = ("forged", *items[5][1:])
+    items[33] = items[33][:3]  # no recid: verified on its own
+    assert ecdsa.verify_batch(items) == [i != 5 for i in range(40)]
+
+def test_recover_public_key():
+    from ecc import curves
+    for c in (curve, curves.get("toy257"), curves.get("toy9739")):
+        d, Q = ECCKeyPair(c).generate_keys()
+        ecdsa = ECDSA(c, private_key=d, public_key=Q)
+        for i in range(20):
+            sig = ecdsa.sign(f"payment {i}")
+            r, s = sig
+            assert sig == (r, s)
+            assert ecdsa.recover_public_key(f"payment {i}", sig) == Q
+
+def test_signing_context_rfc6979_vector():
+    from ecc import curves
+    from ecc.ecdsa import SigningContext
+    c = curves.get("secp256k1")
+    ctx = SigningContext(1, c)
+    sig = ctx.sign("Satoshi Nakamoto")
+    assert sig.r == 0x934b1ea10a4b3c1757e2b0c017d0b6143ce3c9a7e6a4a49860d7a6ab210ee3d8
+    assert min(sig.s, c.n - sig.s) == 0x2442ce9d2b916064108014783e923ec36b49743e2ffa1c4496f01a512aafd9e5
+    assert ECDSA(c, private_key=1).sign("Satoshi Nakamoto") == sig
+    assert ECDSA(c).verify("Satoshi Nakamoto", sig, c.G)
+
+def test_rfc6979_nonce_for_odd_order_length():
+    # RFC 6979 A.1: q is 163 bits, so T must be cut down to its leftmost 163 bits
+    import hashlib
+    from ecc.rfc6979 import RFC6979
+    q = 0x4000000000000000000020108A2E0CC0D99F8A5EF
+    x = 0x09A4D6792295A7F730FC3F2B49CBC0F62E862272F
+    k = RFC6979(x, q).generate_k(hashlib.sha256(b"sample").digest())
+    assert k == 0x23AF4074C90A02B3FE61D286D5C87F425E6BDD81B
+
+def test_presignature_pool():
+    from ecc import curves
+    from ecc.presign import PresignaturePool
+    c = curves.get("toy9739")
+    d, Q = ECCKeyPair(c).generate_keys()
+    ecdsa = ECDSA(c, private_key=d, public_key=Q)
+    for process in (False, True):
+        with PresignaturePool(c, size=16, low_water=4, batch=8, process=process) as pool:
+            ecdsa.use_presignatures(pool)
+            sigs = [ecdsa.sign(f"transfer {i}") for i in range(40)]
+            assert all(ecdsa.verify(f"transfer {i}", sig, Q) for i, sig in enumerate(sigs))
+            stats = pool.stats()
+            assert stats["hits"] + stats["misses"] >= 40
+
+def test_presignature_pool_survives_refill_errors():
+    import time
+    from ecc import curves
+    from ecc.presign import PresignaturePool, make_presignatures
+
+    class FlakyPool(PresignaturePool):
+        failures = 1
+
+        def _make(self, count):
+            if self.failures:
+                self.failures -= 1
+                raise RuntimeError("worker died")
+            return make_presignatures(self.curve, count)
+
+    c = curves.get("toy9739")
+    with FlakyPool(c, size=16, low_water=4, batch=8) as pool:
+        pool.take()  # drops below low_water and wakes the filler again
+        deadline = time.monotonic() + 5
+        while len(pool) < pool.size and time.monotonic() < deadline:
+            time.sleep(0.01)
+        stats = pool.stats()
+        assert stats["errors"] == 1 and isinstance(stats["error"], RuntimeError)
+        assert len(pool) == pool.size
+
+def test_presignature_pool_options_and_ownership():
+    import pytest
+    from ecc import curves
+    from ecc.presign import PresignaturePool
+    c = curves.get("toy9739")
+    with pytest.raises(ValueError):
+        PresignaturePool(c, size=4, low_water=1, batch=0)
+
+    ecdsa = ECDSA(c, private_key=5)
+    first = ecdsa.use_presignatures(size=8, low_water=2, batch=4)
+    with PresignaturePool(c, size=8, low_water=2, batch=4) as mine:
+        ecdsa.use_presignatures(mine)
+        assert first._closed and not first._thread.is_alive()
+        ecdsa.use_presignatures(size=8, low_water=2, batch=4).close()
+        assert not mine._closed  # the caller's pool is left alone
+
+def test_verification_cache_reuses_key_tables():
+    from ecc.ecdsa import VerificationCache
+    cache = VerificationCache(curve, capacity=2)
+    verifier = ECDSA(curve, verify_cache=cache)
+    signers = [ECDSA(curve, *ECCKeyPair(curve).generate_keys()) for _ in range(3)]
+    for _ in range(3):
+        for signer in signers[:2]:
+            assert verifier.verify("hi", signer.sign("hi"), signer.public_key)
+    assert cache.stats()["hits"] == 4 and len(cache) == 2
+
+    assert verifier.verify("hi", signers[2].sign("hi"), signers[2].public_key)
+    assert not verifier.verify("hi", signers[0].sign("hi"), signers[1].public_key)
+    assert len(cache) == 2
+    cache.capacity = 0
+    assert len(cache) == 0
+    assert verifier.verify("hi", signers[0].sign("hi"), signers[0].public_key)
+
+def test_shared_verification_cache_does_not_keep_curve_alive():
+    import gc
+    import weakref
+    temp = EllipticCurve(p=curve.p, a=curve.a, b=curve.b, Gx=curve.G.x, Gy=curve.G.y, n=curve.n)
+    ecdsa = ECDSA(temp)
+    assert ecdsa.verify_cache is ECDSA(temp).verify_cache
+    ref = weakref.ref(temp)
+    del temp, ecdsa
+    gc.collect()
+    assert ref() is None
+
+def test_sign_stream_file_and_digest(tmp_path):
+    import hashlib
+    import io
+    d, Q = ECCKeyPair(curve).generate_keys()
+    ecdsa = ECDSA(curve, private_key=d, public_key=Q)
+    payload = b"statement line\n" * 100000
+    path = tmp_path / "export.csv"
+    path.write_bytes(payload)
+
+    sig = ecdsa.sign_file(path)
+    assert sig == ecdsa.sign(payload) == ecdsa.sign_stream(io.BytesIO(payload))
+    assert sig == ecdsa.sign_digest(hashlib.sha256(payload).digest())
+    with open(path, "rb") as f:
+        assert ecdsa.verify_stream(f, sig, Q)
+    assert ecdsa.verify_digest(hashlib.sha256(payload).digest(), sig, Q)
+    assert not ecdsa.verify_file(path, ecdsa.sign(b"other"), Q)
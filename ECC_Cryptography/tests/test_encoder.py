@@ -1,9 +1,56 @@
 #tests/test_encoder.py
 
-from ecc.encoder import encode_point, decode_point
+import pytest
+
+from ecc import curves
+from ecc.curve import Point
+from ecc.ecdsa import ECDSA
+from ecc.encoder import encode_point, decode_point, encode_point_compressed, decode_point_compressed
+from ecc.encoder import encode_sig, decode_sig, encode_sigs, decode_sigs
 
 def test_encode_decode_point():
     P = (123, 456)
     b = encode_point(P)
     P2 = decode_point(b)
     assert P == P2
+
+def test_compressed_point_round_trip():
+    for name in ("secp256k1", "toy257"):  # p = 3 and p = 1 (mod 4)
+        curve = curves.get(name)
+        for k in (1, 2, 3, 41, 82):
+            P = k * curve.G
+            data = encode_point_compressed(P)
+            assert len(data) == 1 + (curve.p.bit_length() + 7) // 8
+            assert decode_point_compressed(data, curve) == P
+        assert decode_point_compressed(encode_point_compressed(curve.O), curve) is curve.O
+
+def test_compressed_point_with_zero_y():
+    curve = curves.get("toy23")  # (4, 0) is on y^2 = x^3 + x + 1 over F_23
+    assert decode_point_compressed(b"\x02\x04", curve) == Point(4, 0, curve)
+    with pytest.raises(ValueError):
+        decode_point_compressed(b"\x03\x04", curve)
+
+def test_signature_round_trip():
+    curve = curves.get("secp256k1")
+    sig = ECDSA(curve, private_key=12345).sign("hello")
+    data = encode_sig(sig)
+    assert len(data) == 64 and decode_sig(data) == sig
+    der = encode_sig(sig, "der")
+    assert der[0] == 0x30 and decode_sig(der, "der") == sig
+    assert encode_sig((1, 0x80), "der") == bytes.fromhex("3007020101020200 80".replace(" ", ""))
+    toy = curves.get("toy257")
+    assert len(encode_sig((5, 6), curve=toy)) == 2 * ((toy.n.bit_length() + 7) // 8)
+
+def test_bulk_signature_decode():
+    sigs = [(r, r // 7 + 1) for r in (1, 2**255, 2**200 + 3)]
+    for fmt in ("compact", "der"):
+        buf = bytearray(encode_sigs(sigs, fmt))
+        assert decode_sigs(memoryview(buf), fmt) == sigs
+    with pytest.raises(ValueError):
+        decode_sigs(b"\x00" * 65)
+
+def test_malformed_der_signature():
+    der = encode_sig((1, 2), "der")
+    for bad in (der + b"\x00", der[:-1], b"\x31" + der[1:], b"\x30", bytes.fromhex("300702020001020102")):
+        with pytest.raises(ValueError):
+            decode_sig(bad, "der")
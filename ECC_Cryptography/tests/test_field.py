@@ -0,0 +1,20 @@
+#tests/test_field.py
+
+import pytest
+from ecc.field import PythonField, Gmpy2Field, gmpy2
+
+BACKENDS = [PythonField] + ([Gmpy2Field] if gmpy2 is not None else [])
+
+@pytest.mark.parametrize("Field", BACKENDS)
+def test_inv_and_sqrt(Field):
+    for p in (23, 257, 9739, 10009, 65537):  # covers p = 3 and p = 1 (mod 4)
+        F = Field(p)
+        for x in range(1, min(p, 200)):
+            assert x * F.inv(x) % F.p == 1
+            root = F.sqrt(x)
+            if root is None:
+                assert pow(x, (p - 1) // 2, p) == p - 1
+            else:
+                assert root * root % F.p == x % p
+    with pytest.raises(ZeroDivisionError):
+        PythonField(23).inv(0)
@@ -0,0 +1,46 @@
+#tests/test_treehash.py
+
+import os
+
+from ecc import curves, treehash
+from ecc.ecdsa import ECDSA
+
+
+def test_tree_matches_for_file_and_bytes(tmp_path):
+    data = os.urandom(10 * 1000 + 17)
+    path = tmp_path / "archive.bin"
+    path.write_bytes(data)
+    tree = treehash.TreeHash.from_file(path, chunk_size=1000, workers=4)
+    assert len(tree.leaves) == 11
+    assert tree.digest == treehash.TreeHash.from_bytes(data, chunk_size=1000, workers=1).digest
+    assert tree.digest != treehash.TreeHash.from_bytes(data, chunk_size=999).digest
+
+    leaves = treehash.leaf_count(len(data), 1000)
+    assert leaves == 11
+    for i in range(11):
+        chunk = data[i * 1000:(i + 1) * 1000]
+        assert treehash.verify_chunk(chunk, i, tree.proof(i), tree.root, leaves)
+    assert not treehash.verify_chunk(b"x" * 1000, 3, tree.proof(3), tree.root, leaves)
+
+def test_chunk_proof_is_bound_to_its_index():
+    data = os.urandom(11 * 1000)
+    tree = treehash.TreeHash.from_bytes(data, chunk_size=1000)
+    chunk = data[3000:4000]
+    assert treehash.verify_chunk(chunk, 3, tree.proof(3), tree.root, 11)
+    for index in (2, 7, 11, -1):
+        assert not treehash.verify_chunk(chunk, index, tree.proof(3), tree.root, 11)
+    assert not treehash.verify_chunk(chunk, 3, tree.proof(3)[:-1], tree.root, 11)
+
+def test_sign_and_verify_tree_digest(tmp_path):
+    curve = curves.get("secp256k1")
+    ecdsa = ECDSA(curve, private_key=42, public_key=42 * curve.G)
+    path = tmp_path / "export.csv"
+    path.write_bytes(b"row\n" * 50000)
+    tree, sig = treehash.sign_file(ecdsa, path, chunk_size=4096)
+    assert treehash.verify_file(ecdsa, path, sig, ecdsa.public_key, chunk_size=4096)
+    path.write_bytes(b"row\n" * 49999 + b"bad\n")
+    assert not treehash.verify_file(ecdsa, path, sig, ecdsa.public_key, chunk_size=4096)
+
+    empty = tmp_path / "empty"
+    empty.write_bytes(b"")
+    assert treehash.TreeHash.from_file(empty).digest == treehash.TreeHash.from_bytes(b"").digest
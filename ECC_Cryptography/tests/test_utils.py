@@ -1,7 +1,25 @@
 #tests/test_utils.py
 
-from ecc.utils import sha256_int
+import pytest
+from ecc.utils import sha256_int, sha256_bytes, sha256_stream, sha256_file, batch_inverse
 
 def test_sha256_int():
     x = sha256_int("hello")
     assert isinstance(x, int)
+    assert sha256_int(b"hello") == x
+
+def test_sha256_stream_and_file(tmp_path):
+    import io
+    data = bytes(range(256)) * 5000
+    path = tmp_path / "data.bin"
+    path.write_bytes(data)
+    assert sha256_stream(io.BytesIO(data), chunk_size=4096) == sha256_bytes(data)
+    assert sha256_file(path) == sha256_bytes(data)
+    (tmp_path / "empty").write_bytes(b"")
+    assert sha256_file(tmp_path / "empty") == sha256_bytes(b"")
+
+def test_batch_inverse():
+    values = [3, 10, 22, 5, 1]
+    assert batch_inverse(values, 23) == [pow(v, -1, 23) for v in values]
+    with pytest.raises(ZeroDivisionError):
+        batch_inverse([4, 0], 23)
@@ -0,0 +1,30 @@
+#tests/test_vectorized.py
+
+import pytest
+from ecc import curves
+from ecc.curve import EllipticCurve, Point
+
+np = pytest.importorskip("numpy")
+from ecc.vectorized import PointArray, batch_inverse, scalar_mult  # noqa: E402
+
+
+def test_batch_inverse():
+    p = 2147483647
+    values = np.arange(1, 1002, dtype=np.int64) * 7919
+    assert (values * batch_inverse(values, p) % p == 1).all()
+    with pytest.raises(ZeroDivisionError):
+        batch_inverse([3, 0], p)
+
+def test_add_and_mult_match_point_arithmetic():
+    curve = EllipticCurve(p=23, a=1, b=1, Gx=3, Gy=10, n=7)
+    points = [Point(x, y, curve) for x in range(23) for y in range(23)
+              if (y * y - x ** 3 - x - 1) % 23 == 0] + [curve.O]
+    A = PointArray.from_points([P for P in points for _ in points])
+    B = PointArray.from_points([Q for _ in points for Q in points])
+    assert (A + B).to_points() == [P + Q for P in points for Q in points]
+    assert (-A).double().to_points() == [-(2 * P) for P in A.to_points()]
+
+def test_scalar_mult_many_scalars():
+    curve = curves.get("toy9739")
+    ks = np.arange(0, 3000, 7)
+    assert scalar_mult(ks, curve.G).to_points() == [int(k) * curve.G for k in ks]
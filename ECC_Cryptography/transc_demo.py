@@ -1,16 +1,9 @@
-from ecc.curve import EllipticCurve
+from ecc import curves
 from ecc.keys import ECCKeyPair
 from ecc.ecdsa import ECDSA
 
 # Setup curve (use same curve you used in the tests)
-curve = EllipticCurve(
-    p=0xFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFEFFFFFC2F,
-    a=0,
-    b=7,
-    Gx=55066263022277343669578718895168534326250603453777594175500187360389116729240,
-    Gy=32670510020758816978083085130507043184471273380659243275938904335757337482424,
-    n=0xFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFEBAAEDCE6AF48A03BBFD25E8CD0364141
-)
+curve = curves.get("secp256k1")
 
 print("\n=== BANKING TRANSACTION DEMO ===")
 
@@ -3,14 +3,58 @@
 # =======================================
 
 # Curve parameters will be passed from outside for flexibility
+import os
+
+# gmpy2 is used when the ECC_FIELD_BACKEND flag allows it ("auto" = when
+# installed, "gmpy2" = required, "python" = never): for inversions and
+# square roots, and ec_scalar_mul runs its additions modulo an mpz p.
+_backend = os.environ.get("ECC_FIELD_BACKEND", "auto").lower()
+try:
+    if _backend == "python":
+        raise ImportError
+    import gmpy2
+except ImportError:
+    if _backend == "gmpy2":
+        raise
+    gmpy2 = None
+
+def _powmod(x, e, p):
+    if gmpy2 is not None:
+        return int(gmpy2.powmod(x, e, p))
+    return pow(x, e, p)
 
 def sqrt_mod(a, p):
-    for x in range(p):
-        if (x*x) % p == a:
-            return x
-    return None
+    # Smallest square root of a mod p (same answer as trying x = 0, 1, 2, ...),
+    # via Tonelli-Shanks instead of a linear search
+    a %= p
+    if a == 0 or p == 2:
+        return a
+    if _powmod(a, (p - 1) // 2, p) != 1:
+        return None
+    if p % 4 == 3:
+        r = _powmod(a, (p + 1) // 4, p)
+    else:
+        q, s = p - 1, 0
+        while q % 2 == 0:
+            q //= 2
+            s += 1
+        z = 2
+        while _powmod(z, (p - 1) // 2, p) != p - 1:
+            z += 1
+        m, c, t, r = s, _powmod(z, q, p), _powmod(a, q, p), _powmod(a, (q + 1) // 2, p)
+        while t != 1:
+            i, t2 = 0, t
+            while t2 != 1:
+                t2 = t2 * t2 % p
+                i += 1
+            b = _powmod(c, 1 << (m - i - 1), p)
+            m, c = i, b * b % p
+            t, r = t * c % p, r * b % p
+    return min(r, p - r)
 
 def inv_mod(k, p):
+    if gmpy2 is not None:
+        return int(gmpy2.invert(k, p))
     return pow(k, p-2, p)
 
 # ECC Operations
@@ -30,6 +74,12 @@ def ec_add(P, Q, a, p):
     return (x3, y3)
 
 def ec_scalar_mul(k, P, a, p):
+    if gmpy2 is not None:
+        R = _ec_scalar_mul(k, P, a, gmpy2.mpz(p))
+        return None if R is None else (int(R[0]), int(R[1]))
+    return _ec_scalar_mul(k, P, a, p)
+
+def _ec_scalar_mul(k, P, a, p):
     R = None
     Q = P
     while k > 0:
@@ -1,11 +1,30 @@
 # curve.py
 # secp256k1 parameters 
+import os
+
+# Optional gmpy2 fast path, switched by the ECC_FIELD_BACKEND flag that
+# ecc.field reads ("auto" = gmpy2 when installed, "gmpy2" = required,
+# "python" = never). With gmpy2 the point arithmetic below runs on mpz
+# values (via the mpz modulus _p) and inversions use gmpy2.invert.
+_backend = os.environ.get("ECC_FIELD_BACKEND", "auto").lower()
+try:
+    if _backend == "python":
+        raise ImportError
+    import gmpy2
+except ImportError:
+    if _backend == "gmpy2":
+        raise
+    gmpy2 = None
 
 # Curve: y^2 = x^3 + ax + b over finite field p
 p = 0xFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFEFFFFFC2F
 a = 0
 b = 7
 
+# modulus used by the point arithmetic: an mpz when gmpy2 is active, so
+# every product and reduction in _add runs in GMP
+_p = gmpy2.mpz(p) if gmpy2 is not None else p
+
 # Generator point
 G = (
     55066263022277343669578718895168534326250603453777594175500187360389116729240,
@@ -19,10 +38,19 @@ O = None  # point at infinity
 
 # --- Elliptic Curve Operations ---
 def inv_mod(x, p):
+    if gmpy2 is not None:
+        return int(gmpy2.invert(x, p))
     return pow(x, -1, p)
 
 def add(P, Q):
     """Add two points P and Q on the curve."""
+    return _to_int(_add(P, Q))
+
+def _to_int(P):
+    return None if P is None else (int(P[0]), int(P[1]))
+
+def _add(P, Q):
+    """add() without converting the result back from mpz."""
     if P is None:
         return Q
     if Q is None:
@@ -36,13 +64,13 @@ def add(P, Q):
 
     if P == Q:
         # Point doubling
-        l = (3 * x1 * x1 + a) * inv_mod(2 * y1, p) % p
+        l = (3 * x1 * x1 + a) * inv_mod(2 * y1, _p) % _p
     else:
         # Point addition
-        l = (y2 - y1) * inv_mod(x2 - x1, p) % p
+        l = (y2 - y1) * inv_mod(x2 - x1, _p) % _p
 
-    x3 = (l * l - x1 - x2) % p
-    y3 = (l * (x1 - x3) - y1) % p
+    x3 = (l * l - x1 - x2) % _p
+    y3 = (l * (x1 - x3) - y1) % _p
 
     return (x3, y3)
 
@@ -53,7 +81,7 @@ def multiply(k, P):
 
     while k > 0:
         if k & 1:
-            R = add(R, N)
-        N = add(N, N)
+            R = _add(R, N)
+        N = _add(N, N)
         k >>= 1
-    return R
+    return _to_int(R)
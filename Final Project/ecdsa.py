@@ -2,10 +2,37 @@
 ##############################################################
 # ECDSA implementation
 ###############################################################
+import mmap
+import os
 import secrets
 from hashlib import sha256
 from curve import G, n, add, multiply
 
+CHUNK_SIZE = 1 << 20  # read size when hashing file objects
+
+
+def message_digest(message):
+    """SHA-256 of a str (UTF-8 encoded) or bytes-like message."""
+    return sha256(message.encode() if isinstance(message, str) else message).digest()
+
+
+def stream_digest(fileobj):
+    """SHA-256 of the rest of a binary file object, read in chunks."""
+    h = sha256()
+    for chunk in iter(lambda: fileobj.read(CHUNK_SIZE), b""):
+        h.update(chunk)
+    return h.digest()
+
+
+def file_digest(path):
+    """SHA-256 of a file, hashed straight from an mmap of it."""
+    with open(path, "rb") as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return sha256(b"").digest()
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            return sha256(mm).digest()
+
+
 class ECDSA:
     def __init__(self):
         # Key generation
@@ -13,7 +40,16 @@ class ECDSA:
         self.public_key = multiply(self.private_key, G)
 
     def sign(self, message):
-        z = int.from_bytes(sha256(message.encode()).digest(), "big")
+        return self.sign_digest(message_digest(message))
+
+    def sign_stream(self, fileobj):
+        return self.sign_digest(stream_digest(fileobj))
+
+    def sign_file(self, path):
+        return self.sign_digest(file_digest(path))
+
+    def sign_digest(self, digest):
+        z = int.from_bytes(digest, "big")
 
         while True:
             k = secrets.randbelow(n - 1) + 1
@@ -31,7 +67,7 @@ class ECDSA:
     def sign_verbose(self, message):
         print("\n=== ECDSA SIGNING STEPS ===")
 
-        z = int.from_bytes(sha256(message.encode()).digest(), "big")
+        z = int.from_bytes(message_digest(message), "big")
         print("1. Message hash (z):", z)
 
         k = secrets.randbelow(n - 1) + 1
@@ -50,18 +86,27 @@ class ECDSA:
         """
         INSECURE: Used ONLY for nonce‑reuse attack demonstration
         """
-        z = int.from_bytes(sha256(message.encode()).digest(), "big")
+        z = int.from_bytes(message_digest(message), "big")
         x, _ = multiply(forced_k, G)
         r = x % n
         s = (pow(forced_k, -1, n) * (z + r * self.private_key)) % n
         return (r, s), z
 
     def verify(self, message, signature, public_key):
+        return self.verify_digest(message_digest(message), signature, public_key)
+
+    def verify_stream(self, fileobj, signature, public_key):
+        return self.verify_digest(stream_digest(fileobj), signature, public_key)
+
+    def verify_file(self, path, signature, public_key):
+        return self.verify_digest(file_digest(path), signature, public_key)
+
+    def verify_digest(self, digest, signature, public_key):
         r, s = signature
         if not (1 <= r < n and 1 <= s < n):
             return False
 
-        z = int.from_bytes(sha256(message.encode()).digest(), "big")
+        z = int.from_bytes(digest, "big")
         w = pow(s, -1, n)
         u1 = (z * w) % n
         u2 = (r * w) % n